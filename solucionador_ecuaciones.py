@@ -17,229 +17,1640 @@ Version: 1.0
 """
 
 import math
+import cmath
 import re
 import sys
 import argparse
 import time
 import tracemalloc
+import decimal
+import signal
+import threading
+import contextlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from fractions import Fraction
+from types import SimpleNamespace
 import matplotlib.pyplot as plt
 from typing import Callable, List, Tuple, Dict, Optional, Any, Union
 
+try:
+    import mpmath
+except ImportError:  # mpmath es opcional: sin el se usa decimal o fractions
+    mpmath = None
+
+def _traducir_ecuacion(ecuacion_str: str) -> str:
+    """
+    Traduce la notacion de la ecuacion a una expresion de Python.
+    
+    Las funciones matematicas quedan como 'math.<funcion>', de modo que el
+    backend numerico se elige al evaluar (math, mpmath, decimal, ...).
+    
+    Args:
+        ecuacion_str: Cadena de texto que representa la ecuacion.
+    
+    Returns:
+        La expresion equivalente en sintaxis de Python.
+    """
+    # Reemplazar operaciones matematicas comunes con sus equivalentes en Python
+    ecuacion_str = ecuacion_str.replace("^", "**")
+    
+    # Insertar operadores de multiplicación donde sea necesario (ej: 4x -> 4*x)
+    ecuacion_str = re.sub(r'(\d)([a-zA-Z])', r'\1*\2', ecuacion_str)
+    
+    # Reemplazar funciones matematicas comunes
+    ecuacion_str = re.sub(r'sin\(', 'math.sin(', ecuacion_str)
+    ecuacion_str = re.sub(r'cos\(', 'math.cos(', ecuacion_str)
+    ecuacion_str = re.sub(r'tan\(', 'math.tan(', ecuacion_str)
+    ecuacion_str = re.sub(r'exp\(', 'math.exp(', ecuacion_str)
+    ecuacion_str = re.sub(r'log\(', 'math.log(', ecuacion_str)
+    ecuacion_str = re.sub(r'ln\(', 'math.log(', ecuacion_str)
+    ecuacion_str = re.sub(r'sqrt\(', 'math.sqrt(', ecuacion_str)
+    return ecuacion_str
+
+
 def analizar_ecuacion(ecuacion_str: str) -> Callable[[float], float]:
     """
-    Convierte una cadena de texto que representa una ecuacion en una funcion evaluable.
+    Convierte una cadena de texto que representa una ecuacion en una funcion evaluable.
+    
+    Args:
+        ecuacion_str: Cadena de texto que representa la ecuacion a resolver.
+    
+    Returns:
+        Una funcion que evalua la ecuacion para un valor dado de x.
+    """
+    ecuacion_str = _traducir_ecuacion(ecuacion_str)
+    
+    # Crear la funcion
+    try:
+        def f(x):
+            try:
+                return eval(ecuacion_str)
+            except Exception as e:
+                print(f"Error al evaluar la ecuacion: {e}")
+                return float('nan')
+        
+        # Probar la funcion para verificar que sea valida
+        f(0)
+        return f
+    except Exception as e:
+        print(f"Error al analizar la ecuacion: {e}")
+        print("Asegurate de que la ecuacion este correctamente escrita.")
+        return None
+
+
+def analizar_ecuacion_compleja(ecuacion_str: str) -> Callable[[complex], complex]:
+    """
+    Convierte una ecuacion en una funcion evaluable en el plano complejo.
+    
+    Las funciones matematicas se evaluan con cmath, de modo que la ecuacion
+    esta definida tambien donde su version real da NaN o un error de dominio
+    (ej: sqrt o log de numeros negativos).
+    
+    Args:
+        ecuacion_str: Cadena de texto que representa la ecuacion a resolver.
+    
+    Returns:
+        Una funcion que evalua la ecuacion para un valor complejo de x.
+    """
+    ecuacion_str = _traducir_ecuacion(ecuacion_str)
+    
+    # Crear la funcion
+    try:
+        codigo = compile(ecuacion_str, '<ecuacion>', 'eval')
+        
+        def f(x):
+            try:
+                return complex(eval(codigo, {'math': cmath, 'x': x}))
+            except Exception as e:
+                print(f"Error al evaluar la ecuacion: {e}")
+                return complex('nan')
+        
+        # Probar la funcion para verificar que sea valida
+        f(1j)
+        return f
+    except Exception as e:
+        print(f"Error al analizar la ecuacion: {e}")
+        print("Asegurate de que la ecuacion este correctamente escrita.")
+        return None
+
+
+def derivada(f: Callable[[float], float], x: float, h: float = 1e-6,
+             fx: Optional[float] = None) -> float:
+    """
+    Calcula la derivada numerica de una funcion en un punto dado.
+    
+    Args:
+        f: Funcion a derivar.
+        x: Punto donde se evalua la derivada.
+        h: Tamano del paso para la aproximacion numerica.
+        fx: Valor de f(x) si ya se conoce, para ahorrar una evaluacion.
+    
+    Returns:
+        El valor de la derivada en el punto x.
+    """
+    if fx is None:
+        fx = f(x)
+    return (f(x + h) - fx) / h
+
+
+def derivada_central(f: Callable[[float], float], x: float, h: float = 1e-5) -> float:
+    """
+    Calcula la derivada numerica de una funcion por diferencia central.
+    
+    Cuesta una evaluacion mas que derivada() pero su error es O(h^2), lo que
+    la mantiene precisa muy cerca de raices multiples, donde f' tiende a cero.
+    
+    Args:
+        f: Funcion a derivar.
+        x: Punto donde se evalua la derivada.
+        h: Tamano del paso relativo.
+    
+    Returns:
+        El valor de la derivada en el punto x.
+    """
+    paso = h * (1 + abs(x))
+    return (f(x + paso) - f(x - paso)) / (2 * paso)
+
+
+def calcular_error(actual: float, anterior: float) -> Tuple[float, float]:
+    """
+    Calcula el error absoluto y relativo entre dos aproximaciones sucesivas.
+    
+    Args:
+        actual: Valor actual.
+        anterior: Valor anterior.
+    
+    Returns:
+        Una tupla con el error absoluto y el error relativo.
+    """
+    error_abs = abs(actual - anterior)
+    error_rel = error_abs / abs(actual) if actual != 0 else float('inf')
+    return error_abs, error_rel
+
+
+MOTIVOS_TERMINACION = {
+    'convergencia': "se alcanzo la tolerancia",
+    'max_iter': "se alcanzo el numero maximo de iteraciones",
+    'derivada_nula': "la derivada es cercana a cero",
+    'intervalo_invalido': "f(a) y f(b) no tienen signos opuestos",
+    'tiempo_agotado': "se agoto el tiempo maximo",
+    'evaluaciones_agotadas': "se agoto el numero maximo de evaluaciones de f",
+    'cancelado': "la solucion fue cancelada",
+    'jacobiano_singular': "el jacobiano es singular",
+    'ciclo_2': "se detecto un ciclo de periodo 2",
+    'ciclo_3': "se detecto un ciclo de periodo 3",
+    'ciclo_4': "se detecto un ciclo de periodo 4",
+    'divergencia': "los iterados divergen",
+    'estancamiento': "los iterados dejaron de avanzar",
+}
+
+
+class PresupuestoAgotado(Exception):
+    """Se lanza al evaluar f cuando la solucion ya agoto su presupuesto."""
+    
+    def __init__(self, motivo: str):
+        super().__init__(MOTIVOS_TERMINACION[motivo])
+        self.motivo = motivo
+
+
+def aplicar_presupuesto(f: Callable[[float], float], tiempo_max: Optional[float] = None,
+                        max_evaluaciones: Optional[int] = None,
+                        cancelacion: Optional[Any] = None) -> Callable[[float], float]:
+    """
+    Envuelve f para que cada evaluacion respete un presupuesto.
+    
+    Args:
+        f: Funcion a envolver.
+        tiempo_max: Tiempo maximo en segundos desde ahora (None: sin limite).
+        max_evaluaciones: Numero maximo de evaluaciones de f (None: sin limite).
+        cancelacion: Objeto con metodo is_set() (ej: threading.Event) que
+            cancela la solucion desde fuera cuando se activa.
+    
+    Returns:
+        Una funcion equivalente a f que lanza PresupuestoAgotado cuando se
+        agota el presupuesto. El atributo 'evaluaciones' lleva la cuenta.
+    """
+    if tiempo_max is None and max_evaluaciones is None and cancelacion is None:
+        return f
+    
+    limite_tiempo = time.time() + tiempo_max if tiempo_max is not None else None
+    
+    def f_con_presupuesto(x):
+        if cancelacion is not None and cancelacion.is_set():
+            raise PresupuestoAgotado('cancelado')
+        if limite_tiempo is not None and time.time() >= limite_tiempo:
+            raise PresupuestoAgotado('tiempo_agotado')
+        if max_evaluaciones is not None and f_con_presupuesto.evaluaciones >= max_evaluaciones:
+            raise PresupuestoAgotado('evaluaciones_agotadas')
+        f_con_presupuesto.evaluaciones += 1
+        return f(x)
+    
+    f_con_presupuesto.evaluaciones = 0
+    return f_con_presupuesto
+
+
+def describir_motivo(motivo: str) -> str:
+    """Retorna la descripcion legible de un motivo de terminacion."""
+    return MOTIVOS_TERMINACION.get(motivo, motivo)
+
+
+def estimar_orden_convergencia(valores: List[Any]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Estima el orden de convergencia observado y la constante asintotica del error.
+    
+    Con los pasos e_k = |x_k+1 - x_k| como estimacion del error, el orden es
+    p = log(e_k+1 / e_k) / log(e_k / e_k-1) y la constante C = e_k+1 / e_k^p.
+    
+    Args:
+        valores: Historial de iterados.
+    
+    Returns:
+        Una tupla (p, C), o (None, None) si el historial no alcanza para
+        estimarlos o los pasos son demasiado irregulares para dar un orden.
+    """
+    # Los pasos nulos (iterado repetido al alcanzar la precision de maquina)
+    # no aportan informacion sobre el orden
+    pasos = [abs(valores[i + 1] - valores[i]) for i in range(max(0, len(valores) - 6), len(valores) - 1)]
+    pasos = [e for e in pasos if e > 0]
+    if len(pasos) < 3:
+        return None, None
+    
+    e1, e2, e3 = pasos[-3:]
+    # Con pasos casi iguales el denominador se anula y p no tiene sentido
+    denominador = math.log(e2 / e1)
+    if abs(denominador) < 1e-12:
+        return None, None
+    p = math.log(e3 / e2) / denominador
+    # Ningun metodo del modulo supera el orden 3: valores fuera de rango son
+    # ruido de los ultimos pasos, no un orden observado
+    if not math.isfinite(p) or not 0 < p < 10:
+        return None, None
+    try:
+        C = e3 / e2 ** p
+    except (OverflowError, ZeroDivisionError):
+        C = float('inf')
+    return p, C
+
+
+def diagnosticar_convergencia(valores: List[Any], derivadas: Optional[List[Any]] = None,
+                              ventana: int = 4, informe: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """
+    Revisa el historial de iterados y detecta ejecuciones condenadas a fallar.
+    
+    Se llama en cada iteracion, asi que solo mira las ultimas 2 * ventana + 1
+    entradas. Los casos detectados son:
+    - ciclos de periodo 2 a 4 (x_k ~ x_k-p con amplitud no despreciable);
+    - divergencia monotona (|x| crece sin que los pasos se reduzcan, ya sea
+      porque crecen o porque f' se aplana hasta casi cero hacia una raiz en
+      el infinito);
+    - estancamiento (los pasos, ya del orden del ruido de redondeo, dejan de
+      reducirse: la tolerancia pedida esta fuera del alcance de float64).
+    
+    Un recorrido caotico no se considera estancamiento: puede ser un
+    transitorio que termina en una raiz. Tampoco lo es una convergencia
+    lineal sostenida (orden observado p ~ 1 con C < 1, tipica de una raiz
+    multiple), que es lenta pero sigue reduciendo el error.
+    
+    Args:
+        valores: Historial de iterados.
+        derivadas: Historial de f'(x_k), si se dispone de el.
+        ventana: Numero de pasos que se comparan en cada verificacion.
+        informe: Diccionario que, si se da, se actualiza con el orden ('orden'),
+            la constante asintotica ('constante') y si la convergencia es
+            lineal ('convergencia_lineal') segun estimar_orden_convergencia.
+    
+    Returns:
+        El motivo ('ciclo_2', 'ciclo_3', 'ciclo_4', 'divergencia' o
+        'estancamiento') o None si no hay evidencia de fallo.
+    """
+    n = len(valores)
+    x = valores[-1]
+    escala = 1 + abs(x)
+    
+    # La estimacion debe repetirse con el iterado anterior: en un recorrido
+    # caotico tres pasos pueden parecer lineales por casualidad
+    orden, constante = estimar_orden_convergencia(valores)
+    orden_previo, constante_previa = estimar_orden_convergencia(valores[:-1])
+    lineal = all(p is not None and abs(p - 1) < 0.15 and c < 1
+                 for p, c in ((orden, constante), (orden_previo, constante_previa)))
+    if informe is not None:
+        informe.update(orden=orden, constante=constante, convergencia_lineal=lineal)
+    
+    for periodo in (2, 3, 4):
+        if n < 2 * periodo + 1:
+            break
+        ultimos = valores[-periodo:]
+        amplitud = max(abs(u - v) for u in ultimos for v in ultimos)
+        if amplitud > 1e-8 * escala and all(
+                abs(valores[-j] - valores[-j - periodo]) <= 1e-3 * amplitud for j in range(1, periodo + 2)):
+            return f'ciclo_{periodo}'
+    
+    if n < ventana + 2:
+        return None
+    
+    recientes = valores[-(ventana + 2):]
+    pasos = [abs(recientes[i + 1] - recientes[i]) for i in range(len(recientes) - 1)]
+    modulos = [abs(v) for v in recientes]
+    crece = all(m2 > m1 for m1, m2 in zip(modulos, modulos[1:]))
+    sin_reduccion = all(p2 >= 0.9 * p1 for p1, p2 in zip(pasos, pasos[1:]))
+    
+    if crece and sin_reduccion:
+        pasos_crecen = all(p2 >= p1 for p1, p2 in zip(pasos, pasos[1:]))
+        se_aplana = derivadas is not None and len(derivadas) >= ventana + 1 and abs(derivadas[-1]) < 1e-8 and all(
+            abs(d2) < abs(d1) for d1, d2 in zip(derivadas[-(ventana + 1):], derivadas[-ventana:]))
+        if pasos_crecen or se_aplana:
+            return 'divergencia'
+    
+    if n < 2 * ventana + 1:
+        return None
+    
+    recientes = valores[-(2 * ventana + 1):]
+    pasos = [abs(recientes[i + 1] - recientes[i]) for i in range(len(recientes) - 1)]
+    # Pasos de unas pocas ulp: por debajo de esto float64 ya no distingue los iterados
+    ruido = 100 * sys.float_info.epsilon * escala
+    if not lineal and max(pasos[ventana:]) < ruido and min(pasos[ventana:]) >= 0.5 * min(pasos[:ventana]):
+        return 'estancamiento'
+    
+    return None
+
+
+def _detener_medicion(tiempo_inicio: float) -> Tuple[float, int]:
+    """Detiene la medicion y retorna el tiempo transcurrido y el pico de memoria."""
+    tiempo_fin = time.time()
+    memoria_actual, memoria_pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tiempo_fin - tiempo_inicio, memoria_pico
+
+
+def metodo_biseccion(f: Callable[[float], float], a: float, b: float, 
+                    tol: float = 1e-6, max_iter: int = 100,
+                    tiempo_max: Optional[float] = None, max_evaluaciones: Optional[int] = None,
+                    cancelacion: Optional[Any] = None,
+                    estado: Optional[Dict[str, Any]] = None) -> Tuple[float, int, List[float], List[float], List[float], float, float, str]:
+    """
+    Implementa el metodo de biseccion para encontrar una raiz de f en [a, b].
+    
+    Args:
+        f: Funcion cuya raiz se busca.
+        a: Extremo izquierdo del intervalo.
+        b: Extremo derecho del intervalo.
+        tol: Tolerancia para el criterio de parada.
+        max_iter: Numero maximo de iteraciones, contando las de ejecuciones previas
+            si se reanuda desde un estado.
+        tiempo_max: Tiempo maximo de la solucion en segundos.
+        max_evaluaciones: Numero maximo de evaluaciones de f.
+        cancelacion: Token de cancelacion externo (ej: threading.Event).
+        estado: Diccionario serializable con el punto de control. Si contiene un
+            estado de biseccion, se reanuda desde su intervalo (a y b se ignoran);
+            al terminar se actualiza con el intervalo, f(a) y los contadores.
+    
+    Returns:
+        Una tupla con la raiz aproximada, el numero de iteraciones realizadas,
+        una lista con los valores intermedios, una lista con los errores absolutos,
+        una lista con los errores relativos, el tiempo de ejecucion, el uso de memoria
+        en bytes y el motivo de terminacion (ver MOTIVOS_TERMINACION). Si se agota
+        el presupuesto se retorna el punto medio del intervalo actual.
+    """
+    f = aplicar_presupuesto(f, tiempo_max, max_evaluaciones, cancelacion)
+    reanudar = bool(estado) and estado.get('metodo') == 'biseccion'
+    
+    if reanudar:
+        a, b, fa = estado['a'], estado['b'], estado['fa']
+    else:
+        # Verificar que f(a) y f(b) tengan signos opuestos
+        try:
+            fa, fb = f(a), f(b)
+        except PresupuestoAgotado as e:
+            return None, 0, [], [], [], 0, 0, e.motivo
+        if fa * fb >= 0:
+            print(f"Error: f(a) = {fa} y f(b) = {fb} deben tener signos opuestos.")
+            return None, 0, [], [], [], 0, 0, 'intervalo_invalido'
+    
+    # Inicializacion
+    tracemalloc.start()
+    tiempo_inicio = time.time()
+    motivo = 'max_iter'
+    
+    if reanudar:
+        contador_iter = estado['iteraciones']
+        valores_c = list(estado['valores'])
+        errores_abs = list(estado['errores_abs'])
+        errores_rel = list(estado['errores_rel'])
+        c = valores_c[-1]
+    else:
+        contador_iter = 0
+        valores_c = [a]  # Incluir el valor inicial
+        errores_abs = [float('inf')]
+        errores_rel = [float('inf')]
+        
+        # Primera iteracion
+        c = (a + b) / 2
+        valores_c.append(c)
+        error_abs, error_rel = calcular_error(c, a)
+        errores_abs.append(error_abs)
+        errores_rel.append(error_rel)
+    
+    def actualizar_estado():
+        if estado is not None:
+            estado.clear()
+            estado.update({'metodo': 'biseccion', 'a': a, 'b': b, 'fa': fa, 'iteraciones': contador_iter,
+                           'valores': list(valores_c), 'errores_abs': list(errores_abs),
+                           'errores_rel': list(errores_rel)})
+    
+    try:
+        while (b - a) / 2 > tol and contador_iter < max_iter:
+            # Calcular el punto medio
+            c_prev = c
+            c = (a + b) / 2
+            valores_c.append(c)
+            
+            # Calcular errores
+            error_abs, error_rel = calcular_error(c, c_prev)
+            errores_abs.append(error_abs)
+            errores_rel.append(error_rel)
+            
+            # Evaluar la funcion en el punto medio
+            fc = f(c)
+            
+            # Verificar si c es una raiz
+            if abs(fc) < tol:
+                actualizar_estado()
+                tiempo, memoria_pico = _detener_medicion(tiempo_inicio)
+                return c, contador_iter + 1, valores_c, errores_abs, errores_rel, tiempo, memoria_pico, 'convergencia'
+            
+            # Actualizar el intervalo
+            if fa * fc < 0:
+                b = c
+            else:
+                a, fa = c, fc
+            
+            contador_iter += 1
+        
+        if (b - a) / 2 <= tol:
+            motivo = 'convergencia'
+    except PresupuestoAgotado as e:
+        print(f"Advertencia: {describir_motivo(e.motivo).capitalize()}; se retorna el punto medio del intervalo actual.")
+        motivo = e.motivo
+    
+    # El estado se guarda antes de agregar el punto medio final, que la
+    # siguiente ejecucion volvera a calcular como su primer punto
+    actualizar_estado()
+    
+    # Retornar el punto medio del intervalo final
+    c = (a + b) / 2
+    valores_c.append(c)
+    error_abs, error_rel = calcular_error(c, valores_c[-2])
+    errores_abs.append(error_abs)
+    errores_rel.append(error_rel)
+    
+    tiempo, memoria_pico = _detener_medicion(tiempo_inicio)
+    return c, contador_iter + 1, valores_c, errores_abs, errores_rel, tiempo, memoria_pico, motivo
+
+
+def metodo_newton_raphson(f: Callable[[float], float], x0: float, 
+                         tol: float = 1e-6, max_iter: int = 100,
+                         tiempo_max: Optional[float] = None, max_evaluaciones: Optional[int] = None,
+                         cancelacion: Optional[Any] = None,
+                         estado: Optional[Dict[str, Any]] = None, monitorear: bool = True,
+                         respaldo: Optional[Tuple[float, float]] = None,
+                         informe: Optional[Dict[str, Any]] = None) -> Tuple[float, int, List[float], List[float], List[float], float, float, str]:
+    """
+    Implementa el metodo de Newton-Raphson para encontrar una raiz de f.
+    
+    En cada iteracion se revisa el historial con diagnosticar_convergencia,
+    que ademas estima el orden de convergencia en linea. Con monitorear=True
+    el metodo se detiene en cuanto se detecta un ciclo, divergencia o
+    estancamiento, en vez de agotar max_iter.
+    
+    Args:
+        f: Funcion cuya raiz se busca.
+        x0: Aproximacion inicial.
+        tol: Tolerancia para el criterio de parada.
+        max_iter: Numero maximo de iteraciones, contando las de ejecuciones previas
+            si se reanuda desde un estado.
+        tiempo_max: Tiempo maximo de la solucion en segundos.
+        max_evaluaciones: Numero maximo de evaluaciones de f.
+        cancelacion: Token de cancelacion externo (ej: threading.Event).
+        estado: Diccionario serializable con el punto de control. Si contiene un
+            estado de Newton-Raphson, se reanuda desde su iterado (x0 se ignora);
+            al terminar se actualiza con el iterado, f(x) si se conoce y los contadores.
+        monitorear: Si es True, detiene el metodo al diagnosticar un fallo.
+        respaldo: Intervalo (a, b) con cambio de signo. Si se diagnostica un fallo,
+            se continua con biseccion en ese intervalo con las iteraciones restantes.
+        informe: Diccionario que, si se da, se llena con el orden, la constante y
+            la bandera de convergencia lineal estimados por el monitor, y con el
+            metodo que produjo el resultado
+            ('metodo': 'newton', o 'biseccion' si se uso el respaldo).
+    
+    Returns:
+        Una tupla con la raiz aproximada, el numero de iteraciones realizadas,
+        una lista con los valores intermedios, una lista con los errores absolutos,
+        una lista con los errores relativos, el tiempo de ejecucion, el uso de memoria
+        en bytes y el motivo de terminacion (ver MOTIVOS_TERMINACION). Si se agota
+        el presupuesto se retorna el iterado con menor |f(x)| visto hasta entonces.
+    """
+    f = aplicar_presupuesto(f, tiempo_max, max_evaluaciones, cancelacion)
+    
+    # Inicializacion
+    tracemalloc.start()
+    tiempo_inicio = time.time()
+    if estado and estado.get('metodo') == 'newton':
+        x = estado['x']
+        fx_conocido = estado['fx']
+        contador_iter = estado['iteraciones']
+        valores_x = list(estado['valores'])
+        errores_abs = list(estado['errores_abs'])
+        errores_rel = list(estado['errores_rel'])
+        mejor_x, mejor_fx = estado['mejor_x'], estado['mejor_fx']
+    else:
+        x = x0
+        fx_conocido = None
+        contador_iter = 0
+        valores_x = [x0]
+        errores_abs = [float('inf')]
+        errores_rel = [float('inf')]
+        mejor_x, mejor_fx = x0, float('inf')
+    derivadas = []
+    if informe is None:
+        informe = {}
+    informe['metodo'] = 'newton'
+    
+    def actualizar_estado(x_estado, fx_estado, iteraciones):
+        if estado is not None:
+            estado.clear()
+            estado.update({'metodo': 'newton', 'x': x_estado, 'fx': fx_estado, 'iteraciones': iteraciones,
+                           'valores': list(valores_x), 'errores_abs': list(errores_abs),
+                           'errores_rel': list(errores_rel), 'mejor_x': mejor_x, 'mejor_fx': mejor_fx})
+    
+    try:
+        while contador_iter < max_iter:
+            # Calcular la derivada
+            fx = fx_conocido if fx_conocido is not None else f(x)
+            fx_conocido = fx
+            if abs(fx) < mejor_fx:
+                mejor_x, mejor_fx = x, abs(fx)
+            df = derivada(f, x, fx=fx)
+            derivadas.append(df)
+            
+            # Verificar que la derivada no sea cero
+            if abs(df) < 1e-10:
+                print("Error: La derivada es cercana a cero. El metodo puede no converger.")
+                actualizar_estado(x, fx, contador_iter)
+                tiempo, memoria_pico = _detener_medicion(tiempo_inicio)
+                return x, contador_iter, valores_x, errores_abs, errores_rel, tiempo, memoria_pico, 'derivada_nula'
+            
+            # Calcular la nueva aproximacion
+            x_nuevo = x - fx / df
+            valores_x.append(x_nuevo)
+            
+            # Calcular errores
+            error_abs, error_rel = calcular_error(x_nuevo, x)
+            errores_abs.append(error_abs)
+            errores_rel.append(error_rel)
+            
+            # El monitor estima el orden en linea; sus diagnosticos de fallo
+            # solo detienen el metodo con monitorear=True
+            diagnostico = diagnosticar_convergencia(valores_x, derivadas, informe=informe)
+            
+            # Verificar el criterio de parada
+            if abs(x_nuevo - x) < tol:
+                actualizar_estado(x_nuevo, None, contador_iter + 1)
+                tiempo, memoria_pico = _detener_medicion(tiempo_inicio)
+                return x_nuevo, contador_iter + 1, valores_x, errores_abs, errores_rel, tiempo, memoria_pico, 'convergencia'
+            
+            # Actualizar x
+            x = x_nuevo
+            fx_conocido = None
+            contador_iter += 1
+            
+            # Detener de inmediato las ejecuciones que no van a converger
+            if monitorear and diagnostico is not None:
+                print(f"Diagnostico: {describir_motivo(diagnostico).capitalize()} en la iteracion {contador_iter}.")
+                actualizar_estado(x, fx_conocido, contador_iter)
+                tiempo, memoria_pico = _detener_medicion(tiempo_inicio)
+                if respaldo is None:
+                    return mejor_x, contador_iter, valores_x, errores_abs, errores_rel, tiempo, memoria_pico, diagnostico
+                
+                print(f"Cambiando al metodo de biseccion en [{respaldo[0]}, {respaldo[1]}]...")
+                resultados = metodo_biseccion(f, respaldo[0], respaldo[1], tol, max(max_iter - contador_iter, 1))
+                if resultados[0] is None:
+                    return mejor_x, contador_iter, valores_x, errores_abs, errores_rel, tiempo, memoria_pico, diagnostico
+                informe['metodo'] = 'biseccion'
+                return (resultados[0], contador_iter + resultados[1], resultados[2], resultados[3], resultados[4],
+                        tiempo + resultados[5], max(memoria_pico, resultados[6]), resultados[7])
+    except PresupuestoAgotado as e:
+        print(f"Advertencia: {describir_motivo(e.motivo).capitalize()}; se retorna la mejor estimacion.")
+        actualizar_estado(x, fx_conocido, contador_iter)
+        tiempo, memoria_pico = _detener_medicion(tiempo_inicio)
+        return mejor_x, contador_iter, valores_x, errores_abs, errores_rel, tiempo, memoria_pico, e.motivo
+    
+    print("Advertencia: Se alcanzo el numero maximo de iteraciones.")
+    actualizar_estado(x, fx_conocido, contador_iter)
+    tiempo, memoria_pico = _detener_medicion(tiempo_inicio)
+    return x, contador_iter, valores_x, errores_abs, errores_rel, tiempo, memoria_pico, 'max_iter'
+
+
+def metodo_muller(f: Callable[[complex], complex], x0: complex, x1: Optional[complex] = None,
+                  x2: Optional[complex] = None, tol: float = 1e-6, max_iter: int = 100,
+                  tiempo_max: Optional[float] = None, max_evaluaciones: Optional[int] = None,
+                  cancelacion: Optional[Any] = None,
+                  monitorear: bool = True) -> Tuple[complex, int, List[complex], List[float], List[float], float, float, str]:
+    """
+    Implementa el metodo de Muller para encontrar una raiz, real o compleja, de f.
+    
+    En cada paso se ajusta una parabola a los tres ultimos puntos y se toma su
+    raiz mas cercana. No necesita derivada, y como la raiz de la parabola puede
+    ser compleja, el metodo sale del eje real aunque empiece en el. Solo el
+    punto nuevo se evalua: los otros dos valores de f se reutilizan.
+    
+    Args:
+        f: Funcion cuya raiz se busca; debe aceptar argumentos complejos
+            (ver analizar_ecuacion_compleja).
+        x0: Aproximacion inicial.
+        x1: Segundo punto (por defecto, x0 - 0.5).
+        x2: Tercer punto (por defecto, x0 + 0.5).
+        tol: Tolerancia para el criterio de parada.
+        max_iter: Numero maximo de iteraciones.
+        tiempo_max: Tiempo maximo de la solucion en segundos.
+        max_evaluaciones: Numero maximo de evaluaciones de f.
+        cancelacion: Token de cancelacion externo (ej: threading.Event).
+        monitorear: Si es True, detiene el metodo al diagnosticar un fallo.
+    
+    Returns:
+        La misma tupla que metodo_newton_raphson, con la raiz y los valores
+        intermedios como numeros complejos.
+    """
+    f = aplicar_presupuesto(f, tiempo_max, max_evaluaciones, cancelacion)
+    x0 = complex(x0)
+    x1 = complex(x1) if x1 is not None else x0 - 0.5
+    x2 = complex(x2) if x2 is not None else x0 + 0.5
+    
+    # Inicializacion
+    tracemalloc.start()
+    tiempo_inicio = time.time()
+    contador_iter = 0
+    valores_x = [x0]
+    errores_abs = [float('inf')]
+    errores_rel = [float('inf')]
+    mejor_x, mejor_fx = x0, float('inf')
+    motivo = 'max_iter'
+    
+    try:
+        # Los puntos se ordenan para que x2 sea el mas reciente
+        x0, x1, x2 = x1, x2, x0
+        f0, f1, f2 = f(x0), f(x1), f(x2)
+        
+        while contador_iter < max_iter:
+            if abs(f2) < mejor_fx:
+                mejor_x, mejor_fx = x2, abs(f2)
+            
+            # Un iterado exacto no necesita (ni permite) otra parabola
+            if f2 == 0:
+                motivo = 'convergencia'
+                break
+            
+            h1, h2 = x1 - x0, x2 - x1
+            if h1 == 0 or h1 + h2 == 0:
+                # x0 coincide con otro punto: se descarta y se da un paso de
+                # secante con los dos restantes
+                if f2 == f1:
+                    print("Error: Los puntos de interpolacion no determinan un paso. El metodo puede no converger.")
+                    motivo = 'derivada_nula'
+                    break
+                x_nuevo = x2 - f2 * h2 / (f2 - f1)
+            else:
+                # Parabola que pasa por los tres puntos, centrada en x2
+                d1, d2 = (f1 - f0) / h1, (f2 - f1) / h2
+                a = (d2 - d1) / (h2 + h1)
+                b = a * h2 + d2
+                discriminante = cmath.sqrt(b * b - 4 * a * f2)
+                
+                # Se toma el denominador de mayor modulo: da la raiz mas cercana a x2
+                denominador = b + discriminante if abs(b + discriminante) >= abs(b - discriminante) else b - discriminante
+                if denominador == 0:
+                    print("Error: La parabola de interpolacion es degenerada. El metodo puede no converger.")
+                    motivo = 'derivada_nula'
+                    break
+                
+                x_nuevo = x2 - 2 * f2 / denominador
+            valores_x.append(x_nuevo)
+            contador_iter += 1
+            
+            # Calcular errores
+            error_abs, error_rel = calcular_error(x_nuevo, x2)
+            errores_abs.append(error_abs)
+            errores_rel.append(error_rel)
+            
+            x0, x1, x2 = x1, x2, x_nuevo
+            
+            # Verificar el criterio de parada
+            if error_abs < tol:
+                motivo = 'convergencia'
+                break
+            
+            f0, f1, f2 = f1, f2, f(x2)
+            
+            diagnostico = diagnosticar_convergencia(valores_x) if monitorear else None
+            if diagnostico is not None:
+                print(f"Diagnostico: {describir_motivo(diagnostico).capitalize()} en la iteracion {contador_iter}.")
+                motivo = diagnostico
+                break
+    except PresupuestoAgotado as e:
+        print(f"Advertencia: {describir_motivo(e.motivo).capitalize()}; se retorna la mejor estimacion.")
+        motivo = e.motivo
+    except ZeroDivisionError:
+        print("Error: Dos de los puntos de interpolacion coinciden. El metodo puede no converger.")
+        motivo = 'derivada_nula'
+    
+    if motivo == 'max_iter':
+        print("Advertencia: Se alcanzo el numero maximo de iteraciones.")
+    raiz = x2 if motivo == 'convergencia' else mejor_x
+    tiempo, memoria_pico = _detener_medicion(tiempo_inicio)
+    return raiz, contador_iter, valores_x, errores_abs, errores_rel, tiempo, memoria_pico, motivo
+
+
+def guardar_estado(estado: Dict[str, Any], ruta: str) -> None:
+    """
+    Guarda un punto de control de un metodo en un archivo JSON.
+    
+    Args:
+        estado: Estado producido por metodo_biseccion o metodo_newton_raphson.
+        ruta: Archivo de destino.
+    """
+    with open(ruta, 'w') as archivo:
+        json.dump(estado, archivo, indent=2)
+
+
+def cargar_estado(ruta: str) -> Dict[str, Any]:
+    """
+    Carga un punto de control guardado con guardar_estado.
+    
+    Args:
+        ruta: Archivo JSON con el estado.
+    
+    Returns:
+        El estado, listo para pasarlo a un metodo para reanudarlo.
+    """
+    with open(ruta, 'r') as archivo:
+        return json.load(archivo)
+
+
+def analizar_ecuacion_precision(ecuacion_str: str, digitos: int = 50) -> Tuple[Optional[Callable], Optional[Callable], str]:
+    """
+    Convierte una ecuacion en una funcion evaluable en alta precision.
+    
+    El backend se elige segun lo disponible y lo que use la ecuacion:
+    mpmath si esta instalado; fractions (evaluacion exacta) si la ecuacion es
+    un polinomio; decimal si solo usa exp, log y sqrt.
+    
+    Args:
+        ecuacion_str: Cadena de texto que representa la ecuacion a resolver.
+        digitos: Digitos significativos de trabajo.
+    
+    Returns:
+        Una tupla con la funcion en alta precision, una funcion que convierte
+        un float al tipo numerico del backend y el nombre del backend. Si
+        ningun backend puede evaluar la ecuacion se retorna (None, None, 'float64').
+    """
+    expresion = _traducir_ecuacion(ecuacion_str)
+    
+    # Todos los literales, enteros incluidos, se construyen desde su texto en
+    # el tipo del backend: asi 0.1 no arrastra el error de representacion de
+    # float y 1/3 no se evalua como division de Python en float
+    if mpmath is not None:
+        contexto = mpmath.MPContext()
+        contexto.dps = digitos
+        expresion_mp = re.sub(r'(?<![\w.])(\d+(?:\.\d*)?|\.\d+)', r"math.mpf('\1')", expresion)
+        
+        def f_mp(x):
+            return eval(expresion_mp, {'math': contexto, 'x': x})
+        
+        return f_mp, contexto.mpf, 'mpmath'
+    
+    es_polinomio = ('math.' not in expresion
+                    and not re.search(r'\*\*\s*(?!\d+(?![\d.]))', expresion))
+    
+    if es_polinomio:
+        expresion_fr = re.sub(r'(?<![\w.])(\d+(?:\.\d*)?|\.\d+)', r"Fraction('\1')", expresion)
+        
+        def f_fr(x):
+            r = eval(expresion_fr, {'Fraction': Fraction, 'x': Fraction(x)})
+            return decimal.Decimal(r.numerator) / decimal.Decimal(r.denominator)
+        
+        return f_fr, decimal.Decimal, 'fractions'
+    
+    if not re.search(r'math\.(sin|cos|tan)\(', expresion):
+        espacio_decimal = SimpleNamespace(
+            exp=lambda v: decimal.Decimal(v).exp(),
+            log=lambda v: decimal.Decimal(v).ln(),
+            sqrt=lambda v: decimal.Decimal(v).sqrt(),
+        )
+        expresion_dec = re.sub(r'(?<![\w.])(\d+(?:\.\d*)?|\.\d+)', r"Decimal('\1')", expresion)
+        
+        def f_dec(x):
+            return eval(expresion_dec, {'math': espacio_decimal, 'Decimal': decimal.Decimal, 'x': x})
+        
+        return f_dec, decimal.Decimal, 'decimal'
+    
+    return None, None, 'float64'
+
+
+def requiere_alta_precision(f: Callable[[float], float], x: float, tol: float) -> Tuple[bool, str]:
+    """
+    Decide si una raiz obtenida en float64 necesita refinarse en alta precision.
+    
+    Se considera perdida de significancia cuando la tolerancia esta por debajo
+    del epsilon de maquina relativo a x, cuando la derivada es casi nula (raiz
+    mal condicionada o multiple) o cuando la estimacion del error |f(x)/f'(x)|
+    sigue siendo mayor que la tolerancia.
+    
+    Args:
+        f: Funcion evaluada en float64.
+        x: Raiz aproximada.
+        tol: Tolerancia pedida.
+    
+    Returns:
+        Una tupla con la decision y el motivo.
+    """
+    fx = f(x)
+    if math.isnan(fx):
+        return False, "f(x) no es un numero"
+    
+    if tol < 4 * sys.float_info.epsilon * max(1.0, abs(x)):
+        return True, "la tolerancia esta por debajo de la precision de float64"
+    
+    df = derivada(f, x)
+    if abs(df) < 1e-10:
+        return True, "la derivada es casi nula (raiz mal condicionada)"
+    
+    if abs(fx / df) > tol:
+        return True, f"el error estimado |f(x)/f'(x)| = {abs(fx / df):.2e} supera la tolerancia"
+    
+    return False, "float64 es suficiente"
+
+
+def refinar_alta_precision(ecuacion_str: str, x: float, tol: float, max_iter: int = 100,
+                           digitos: Optional[int] = None, tiempo_max: Optional[float] = None,
+                           max_evaluaciones: Optional[int] = None,
+                           cancelacion: Optional[Any] = None) -> Tuple[Any, int, str, str]:
+    """
+    Refina una raiz con el metodo de Newton-Raphson en alta precision.
+    
+    Args:
+        ecuacion_str: Ecuacion a resolver.
+        x: Raiz aproximada obtenida en float64.
+        tol: Tolerancia para el criterio de parada.
+        max_iter: Numero maximo de iteraciones.
+        digitos: Digitos de trabajo (por defecto, los de la tolerancia mas 15).
+        tiempo_max: Tiempo maximo del refinamiento, en segundos.
+        max_evaluaciones: Numero maximo de evaluaciones en alta precision.
+        cancelacion: Token de cancelacion externo (ej: threading.Event).
+    
+    Returns:
+        Una tupla con la raiz refinada en el tipo del backend (None si no hay
+        backend disponible), el numero de iteraciones, el nombre del backend y
+        el motivo de terminacion ('convergencia' solo si |paso| < tol, o el
+        motivo del presupuesto si se agoto).
+    """
+    if digitos is None:
+        digitos = max(30, int(-math.log10(tol)) + 15) if tol > 0 else 50
+    
+    g, a_numero, backend = analizar_ecuacion_precision(ecuacion_str, digitos)
+    if g is None:
+        return None, 0, backend, 'max_iter'
+    g = aplicar_presupuesto(g, tiempo_max, max_evaluaciones, cancelacion)
+    
+    with decimal.localcontext() as contexto:
+        contexto.prec = digitos
+        try:
+            # Diferencia central: el error de truncamiento (h^2) y el de
+            # redondeo (10^-digitos / h) quedan equilibrados
+            h = a_numero(10.0) ** (-(digitos // 3))
+            tol_hp = a_numero(tol)
+            x_hp = a_numero(x)
+            contador_iter = 0
+            paso_anterior = None
+            razones = []
+            multiplicidad = 1
+            motivo = 'max_iter'
+            
+            while contador_iter < max_iter:
+                dg = (g(x_hp + h) - g(x_hp - h)) / (2 * h)
+                if dg == 0:
+                    motivo = 'derivada_nula'
+                    break
+                
+                paso = g(x_hp) / dg
+                
+                # En una raiz de multiplicidad m Newton converge linealmente con
+                # razon (m - 1) / m; al detectarla se usa el paso m * f / f'
+                if multiplicidad == 1 and paso_anterior:
+                    razones.append(float(abs(paso / paso_anterior)))
+                    multiplicidad = _estimar_multiplicidad(razones)
+                paso_anterior = paso
+                
+                x_hp = x_hp - multiplicidad * paso
+                contador_iter += 1
+                
+                if abs(paso) < tol_hp:
+                    motivo = 'convergencia'
+                    break
+        except PresupuestoAgotado as e:
+            motivo = e.motivo
+        except (ArithmeticError, AttributeError, TypeError, ValueError) as e:
+            print(f"Advertencia: No se pudo evaluar la ecuacion con {backend}: {e}")
+            return None, 0, backend, 'max_iter'
+    
+    return x_hp, contador_iter, backend, motivo
+
+
+def metodo_newton_raphson_adaptativo(f: Callable[[float], float], ecuacion_str: str, x0: float,
+                                     tol: float = 1e-6, max_iter: int = 100,
+                                     tiempo_max: Optional[float] = None, max_evaluaciones: Optional[int] = None,
+                                     cancelacion: Optional[Any] = None,
+                                     estado: Optional[Dict[str, Any]] = None, monitorear: bool = True,
+                                     respaldo: Optional[Tuple[float, float]] = None,
+                                     informe: Optional[Dict[str, Any]] = None) -> Tuple[float, int, List[float], List[float], List[float], float, float, str]:
+    """
+    Newton-Raphson con escalamiento adaptativo de precision.
+    
+    Resuelve primero en float64 y solo si la ejecucion termino junto a una
+    raiz (convergio, o se detuvo con un residuo pequeno) y se detecta perdida
+    de significancia, repite el refinamiento final en alta precision.
+    
+    Args:
+        f: Funcion cuya raiz se busca (float64).
+        ecuacion_str: Ecuacion original, necesaria para evaluarla en alta precision.
+        x0: Aproximacion inicial.
+        tol: Tolerancia para el criterio de parada.
+        max_iter: Numero maximo de iteraciones.
+        tiempo_max: Tiempo maximo de la solucion completa, en segundos.
+        max_evaluaciones: Numero maximo de evaluaciones de f, sumando ambas fases.
+        cancelacion: Token de cancelacion externo (ej: threading.Event).
+        estado: Punto de control de la fase en float64 (ver metodo_newton_raphson).
+        monitorear: Si es True, detiene la fase en float64 al diagnosticar un fallo.
+        respaldo: Intervalo (a, b) para continuar con biseccion si se diagnostica un fallo.
+        informe: Orden estimado y metodo de la fase en float64 (ver metodo_newton_raphson).
+            Ademas recibe 'raiz_alta_precision', la raiz refinada en el tipo del
+            backend con todos sus digitos (None si no hubo refinamiento), y 'backend'.
+    
+    Returns:
+        La misma tupla que metodo_newton_raphson. Si el refinamiento converge,
+        la raiz (redondeada a float) y su iteracion se agregan al historial, y
+        los digitos completos quedan en informe; si no, se conserva el resultado
+        en float64 con su motivo de terminacion (o el del presupuesto, si se
+        agoto durante el refinamiento).
+    """
+    inicio = time.time()
+    if informe is None:
+        informe = {}
+    informe.update(raiz_alta_precision=None, backend='float64')
+    # Se cuentan aqui las evaluaciones en float64 para descontarlas del
+    # presupuesto que le queda al refinamiento
+    f_float = aplicar_presupuesto(f, max_evaluaciones=max_evaluaciones)
+    
+    # float64 no puede resolver mas alla de su epsilon: no tiene sentido
+    # gastar iteraciones persiguiendo una tolerancia inalcanzable
+    tol_float = max(tol, 1e-14)
+    resultados = metodo_newton_raphson(f_float, x0, tol_float, max_iter, tiempo_max, None, cancelacion, estado,
+                                       monitorear, respaldo, informe)
+    x = resultados[0]
+    
+    # Si se agoto el presupuesto no se gasta mas en refinar
+    if resultados[7] not in ('convergencia', 'max_iter', 'derivada_nula', 'estancamiento'):
+        return resultados
+    
+    # Refinar solo tiene sentido si float64 ya llego junto a una raiz: una
+    # ejecucion que fallo lejos de ella no mejora con mas digitos
+    if resultados[7] != 'convergencia' and not abs(f(x)) < math.sqrt(sys.float_info.epsilon):
+        return resultados
+    
+    necesita, motivo = requiere_alta_precision(f, x, tol)
+    if not necesita:
+        return resultados
+    
+    print(f"Escalando a alta precision: {motivo}.")
+    tiempo_inicio = time.time()
+    # En una raiz de multiplicidad m solo se recupera 1/m de los digitos de
+    # trabajo, asi que las raices mal condicionadas necesitan mas digitos
+    digitos = max(30, int(-math.log10(tol)) + 15) if tol > 0 else 50
+    if abs(derivada(f, x)) < 1e-10:
+        digitos *= 3
+    tiempo_restante = tiempo_max - (tiempo_inicio - inicio) if tiempo_max is not None else None
+    evaluaciones_restantes = (max_evaluaciones - f_float.evaluaciones
+                              if max_evaluaciones is not None else None)
+    x_hp, iteraciones_hp, backend, motivo_hp = refinar_alta_precision(ecuacion_str, x, tol, max_iter, digitos,
+                                                                      tiempo_restante, evaluaciones_restantes,
+                                                                      cancelacion)
+    tiempo_hp = time.time() - tiempo_inicio
+    
+    if x_hp is None:
+        print("Advertencia: No hay backend de alta precision para esta ecuacion; se conserva el resultado en float64.")
+        return resultados
+    
+    if motivo_hp != 'convergencia':
+        print(f"Advertencia: El refinamiento en alta precision no convergio ({describir_motivo(motivo_hp)}); "
+              "se conserva el resultado en float64.")
+        if motivo_hp in ('tiempo_agotado', 'evaluaciones_agotadas', 'cancelado'):
+            return resultados[:7] + (motivo_hp,)
+        return resultados
+    
+    print(f"Raiz en alta precision ({backend}): {x_hp}")
+    # float64 no puede representar la tolerancia pedida: la raiz que la
+    # cumple es x_hp, no su redondeo
+    informe.update(raiz_alta_precision=x_hp, backend=backend)
+    
+    raiz, contador_iter, valores_x, errores_abs, errores_rel, tiempo, memoria, motivo_float = resultados
+    raiz_hp = float(x_hp)
+    error_abs, error_rel = calcular_error(raiz_hp, raiz)
+    valores_x.append(raiz_hp)
+    errores_abs.append(error_abs)
+    errores_rel.append(error_rel)
+    return raiz_hp, contador_iter + iteraciones_hp, valores_x, errores_abs, errores_rel, tiempo + tiempo_hp, memoria, 'convergencia'
+
+
+def _estimar_multiplicidad(razones: List[float]) -> int:
+    """
+    Estima la multiplicidad de una raiz a partir de las razones entre pasos de Newton.
+    
+    Cerca de una raiz de multiplicidad m, Newton converge linealmente con
+    razon (m - 1) / m. Solo se acepta la estimacion si las tres ultimas
+    razones son estables.
+    
+    Args:
+        razones: Razones |paso_k| / |paso_k-1| observadas.
+    
+    Returns:
+        La multiplicidad estimada (1 si no hay evidencia de raiz multiple).
+    """
+    if len(razones) < 3:
+        return 1
+    ultimas = razones[-3:]
+    q = ultimas[-1]
+    if not 0.4 < q < 0.95 or max(ultimas) - min(ultimas) > 0.05 * q:
+        return 1
+    return round(1 / (1 - q))
+
+
+def _multiplicidad_en_raiz(g: Callable[[float], float], r: float, max_multiplicidad: int = 10) -> int:
+    """
+    Mide la multiplicidad de una raiz deflactando por (x - r) mientras g siga anulandose en r.
+    
+    Si r tiene multiplicidad M, q_m(x) = g(x) / (x - r)^m se comporta como
+    (x - r)^(M - m): al acercarse a r diez veces, |q_m| cae al menos diez
+    veces mientras m < M y se mantiene cuando m = M.
+    
+    Args:
+        g: Funcion evaluada (ya deflactada por las raices anteriores).
+        r: Raiz pulida.
+        max_multiplicidad: Cota para la multiplicidad reportada.
+    
+    Returns:
+        La multiplicidad medida (al menos 1).
+    """
+    delta = 1e-2 * (1 + abs(r))
+    
+    def tamano(m, d):
+        return abs(g(r + d) / d ** m) + abs(g(r - d) / (-d) ** m)
+    
+    m = 1
+    while m < max_multiplicidad:
+        lejos, cerca = tamano(m, delta), tamano(m, delta / 10)
+        if lejos == 0 or cerca > 0.3 * lejos:
+            break
+        m += 1
+    return m
+
+
+def metodo_newton_deflacion(f: Callable[[float], float], x0: float, k: int = 3,
+                            tol: float = 1e-6, max_iter: int = 100,
+                            tiempo_max: Optional[float] = None, max_evaluaciones: Optional[int] = None,
+                            cancelacion: Optional[Any] = None) -> Tuple[List[float], List[int], int, float, float, str]:
+    """
+    Busca hasta k raices de f desde un unico punto inicial mediante deflacion.
+    
+    Tras encontrar cada raiz r de multiplicidad m, Newton continua sobre
+    f(x) / prod((x - r_i)^m_i), de modo que las raices ya halladas dejan de
+    atraer al metodo. La multiplicidad se estima durante la iteracion y se
+    usa el paso m * g / g', que recupera la convergencia cuadratica en
+    raices repetidas. Al converger, la multiplicidad se mide directamente con
+    _multiplicidad_en_raiz y la raiz se pule sobre la f original; si coincide
+    con una ya hallada se suma a su multiplicidad en vez de repetirse.
+    
+    Args:
+        f: Funcion cuyas raices se buscan.
+        x0: Aproximacion inicial, usada para todas las raices.
+        k: Numero maximo de raices a buscar.
+        tol: Tolerancia para el criterio de parada.
+        max_iter: Numero maximo de iteraciones por raiz.
+        tiempo_max: Tiempo maximo de la solucion completa en segundos.
+        max_evaluaciones: Numero maximo de evaluaciones de f en total.
+        cancelacion: Token de cancelacion externo (ej: threading.Event).
+    
+    Returns:
+        Una tupla con la lista de raices, la lista de multiplicidades, el
+        numero total de iteraciones, el tiempo de ejecucion, el uso de memoria
+        en bytes y el motivo de terminacion ('convergencia' si se hallaron las
+        k raices; si no, el motivo por el que fallo la busqueda de la siguiente).
+    """
+    f = aplicar_presupuesto(f, tiempo_max, max_evaluaciones, cancelacion)
+    
+    # Inicializacion
+    tracemalloc.start()
+    tiempo_inicio = time.time()
+    raices = []
+    multiplicidades = []
+    contador_total = 0
+    motivo = 'convergencia'
+    
+    def g(x):
+        valor = f(x)
+        for r, m in zip(raices, multiplicidades):
+            valor /= (x - r) ** m
+        return valor
+    
+    busquedas = 0
+    try:
+        while len(raices) < k and busquedas < 2 * k:
+            busquedas += 1
+            # Evitar arrancar justo sobre un polo de la deflacion
+            x = x0
+            while any(abs(x - r) < 1e3 * tol for r in raices):
+                x += 0.1 * (1 + abs(x))
+            
+            multiplicidad = 1
+            razones = []
+            paso_anterior = None
+            iterados = [x]
+            motivo = 'max_iter'
+            
+            for _ in range(max_iter):
+                # Cerca de una raiz multiple el paso de la diferencia debe ser
+                # menor que la distancia a la raiz, o domina el error O(h^2)
+                h = 1e-5 if paso_anterior is None else min(1e-5, max(1e-3 * abs(paso_anterior), 1e-9))
+                gx = g(x)
+                dg = derivada_central(g, x, h)
+                contador_total += 1
+                if gx == 0:
+                    motivo = 'convergencia'
+                    break
+                if dg == 0 or math.isnan(dg):
+                    motivo = 'derivada_nula'
+                    break
+                
+                # Las razones se miden sobre el paso de Newton sin corregir: con
+                # la multiplicidad correcta caen a cero tras el paso corregido
+                paso_newton = gx / dg
+                if paso_anterior:
+                    razones.append(abs(paso_newton / paso_anterior))
+                    if multiplicidad == 1 and abs(paso_newton) < 1e-2 * (1 + abs(x)):
+                        multiplicidad = _estimar_multiplicidad(razones)
+                    elif multiplicidad > 1 and razones[-1] > 0.5:
+                        # El paso corregido no acelera: la estimacion era erronea
+                        multiplicidad = 1
+                paso_anterior = paso_newton
+                
+                paso = multiplicidad * paso_newton
+                x -= paso
+                if abs(paso) < tol:
+                    motivo = 'convergencia'
+                    break
+                
+                # Sin mas raices reales, Newton sobre la funcion deflactada
+                # suele oscilar o divergir: se detiene en cuanto se detecta
+                iterados.append(x)
+                diagnostico = diagnosticar_convergencia(iterados)
+                if diagnostico is not None:
+                    motivo = diagnostico
+                    break
+            
+            if motivo != 'convergencia':
+                break
+            
+            # La estimacion en linea necesita tres razones estables; si Newton
+            # termino antes, una raiz multiple quedaria con multiplicidad 1
+            multiplicidad = _multiplicidad_en_raiz(g, x)
+            
+            # Pulir la raiz sobre la f original con el paso corregido
+            fx = f(x)
+            for _ in range(5):
+                df = derivada_central(f, x)
+                if df == 0 or fx == 0:
+                    break
+                x_nuevo = x - multiplicidad * fx / df
+                fx_nuevo = f(x_nuevo)
+                if abs(fx_nuevo) >= abs(fx):
+                    break
+                x, fx = x_nuevo, fx_nuevo
+            
+            repetida = next((i for i, r in enumerate(raices) if abs(x - r) < 1e3 * tol), None)
+            if repetida is not None:
+                multiplicidades[repetida] += multiplicidad
+            else:
+                raices.append(x)
+                multiplicidades.append(multiplicidad)
+        
+        if len(raices) < k and motivo == 'convergencia':
+            motivo = 'max_iter'
+    except PresupuestoAgotado as e:
+        print(f"Advertencia: {describir_motivo(e.motivo).capitalize()}; se retornan las raices halladas.")
+        motivo = e.motivo
+    except ZeroDivisionError:
+        motivo = 'derivada_nula'
+    
+    tiempo, memoria_pico = _detener_medicion(tiempo_inicio)
+    return raices, multiplicidades, contador_total, tiempo, memoria_pico, motivo
+
+
+def detectar_variables(ecuaciones: List[str]) -> List[str]:
+    """
+    Detecta los nombres de variable usados en una lista de ecuaciones.
     
     Args:
-        ecuacion_str: Cadena de texto que representa la ecuacion a resolver.
+        ecuaciones: Ecuaciones en formato texto.
     
     Returns:
-        Una funcion que evalua la ecuacion para un valor dado de x.
+        Los nombres de variable en orden alfabetico.
     """
-    # Reemplazar operaciones matematicas comunes con sus equivalentes en Python
-    ecuacion_str = ecuacion_str.replace("^", "**")
+    nombres = set()
+    for ecuacion_str in ecuaciones:
+        expresion = re.sub(r'math\.\w+', '', _traducir_ecuacion(ecuacion_str))
+        nombres.update(re.findall(r'[A-Za-z_]\w*', expresion))
+    return sorted(nombres)
+
+
+def analizar_sistema(ecuaciones: List[str], variables: Optional[List[str]] = None) -> Tuple[Optional[Callable[[List[float]], List[float]]], List[str]]:
+    """
+    Convierte una lista de ecuaciones en una funcion vectorial evaluable.
     
-    # Insertar operadores de multiplicación donde sea necesario (ej: 4x -> 4*x)
-    ecuacion_str = re.sub(r'(\d)([a-zA-Z])', r'\1*\2', ecuacion_str)
+    Args:
+        ecuaciones: Ecuaciones igualadas a cero, una por componente.
+        variables: Nombres de las variables en el orden del vector. Si no se
+            indican se detectan de las ecuaciones en orden alfabetico.
     
-    # Reemplazar funciones matematicas comunes
-    ecuacion_str = re.sub(r'sin\(', 'math.sin(', ecuacion_str)
-    ecuacion_str = re.sub(r'cos\(', 'math.cos(', ecuacion_str)
-    ecuacion_str = re.sub(r'tan\(', 'math.tan(', ecuacion_str)
-    ecuacion_str = re.sub(r'exp\(', 'math.exp(', ecuacion_str)
-    ecuacion_str = re.sub(r'log\(', 'math.log(', ecuacion_str)
-    ecuacion_str = re.sub(r'ln\(', 'math.log(', ecuacion_str)
-    ecuacion_str = re.sub(r'sqrt\(', 'math.sqrt(', ecuacion_str)
+    Returns:
+        Una tupla con la funcion F(x) -> [f1(x), ..., fn(x)] (None si alguna
+        ecuacion no es valida) y la lista de variables.
+    """
+    if variables is None:
+        variables = detectar_variables(ecuaciones)
     
-    # Crear la funcion
     try:
-        def f(x):
+        codigos = [compile(_traducir_ecuacion(e), '<ecuacion>', 'eval') for e in ecuaciones]
+        
+        def F(x):
+            valores = dict(zip(variables, x))
             try:
-                return eval(ecuacion_str)
+                return [eval(codigo, {'math': math}, valores) for codigo in codigos]
             except Exception as e:
-                print(f"Error al evaluar la ecuacion: {e}")
-                return float('nan')
+                print(f"Error al evaluar el sistema: {e}")
+                return [float('nan')] * len(codigos)
         
         # Probar la funcion para verificar que sea valida
-        f(0)
-        return f
+        F([0.0] * len(variables))
+        return F, variables
     except Exception as e:
-        print(f"Error al analizar la ecuacion: {e}")
-        print("Asegurate de que la ecuacion este correctamente escrita.")
-        return None
+        print(f"Error al analizar el sistema: {e}")
+        print("Asegurate de que las ecuaciones esten correctamente escritas.")
+        return None, variables
+
+
+def _norma(v: List[float]) -> float:
+    """Norma euclidiana de un vector."""
+    return math.sqrt(sum(vi * vi for vi in v))
 
 
-def derivada(f: Callable[[float], float], x: float, h: float = 1e-6) -> float:
+def jacobiano_numerico(F: Callable[[List[float]], List[float]], x: List[float],
+                       Fx: Optional[List[float]] = None, h: float = 1e-7) -> List[List[float]]:
     """
-    Calcula la derivada numerica de una funcion en un punto dado.
+    Calcula el jacobiano de F en x por diferencias hacia adelante.
     
     Args:
-        f: Funcion a derivar.
-        x: Punto donde se evalua la derivada.
-        h: Tamano del paso para la aproximacion numerica.
+        F: Funcion vectorial.
+        x: Punto donde se evalua el jacobiano.
+        Fx: Valor de F(x) si ya se conoce, para ahorrar una evaluacion.
+        h: Tamano de paso relativo.
     
     Returns:
-        El valor de la derivada en el punto x.
+        La matriz jacobiana como lista de filas.
     """
-    return (f(x + h) - f(x)) / h
+    if Fx is None:
+        Fx = F(x)
+    n = len(x)
+    J = [[0.0] * n for _ in Fx]
+    for j in range(n):
+        paso = h * max(1.0, abs(x[j]))
+        x_h = list(x)
+        x_h[j] += paso
+        F_h = F(x_h)
+        for i in range(len(Fx)):
+            J[i][j] = (F_h[i] - Fx[i]) / paso
+    return J
 
 
-def calcular_error(actual: float, anterior: float) -> Tuple[float, float]:
+def resolver_lineal(A: List[List[float]], b: List[float]) -> Optional[List[float]]:
     """
-    Calcula el error absoluto y relativo entre dos aproximaciones sucesivas.
+    Resuelve A x = b por eliminacion gaussiana con pivoteo parcial.
     
     Args:
-        actual: Valor actual.
-        anterior: Valor anterior.
+        A: Matriz cuadrada (no se modifica).
+        b: Lado derecho.
     
     Returns:
-        Una tupla con el error absoluto y el error relativo.
+        La solucion x, o None si la matriz es singular.
     """
-    error_abs = abs(actual - anterior)
-    error_rel = error_abs / abs(actual) if actual != 0 else float('inf')
-    return error_abs, error_rel
+    n = len(b)
+    M = [list(fila) + [bi] for fila, bi in zip(A, b)]
+    
+    for k in range(n):
+        pivote = max(range(k, n), key=lambda i: abs(M[i][k]))
+        if abs(M[pivote][k]) < 1e-14:
+            return None
+        M[k], M[pivote] = M[pivote], M[k]
+        for i in range(k + 1, n):
+            factor = M[i][k] / M[k][k]
+            if factor != 0:
+                for j in range(k, n + 1):
+                    M[i][j] -= factor * M[k][j]
+    
+    x = [0.0] * n
+    for i in range(n - 1, -1, -1):
+        x[i] = (M[i][n] - sum(M[i][j] * x[j] for j in range(i + 1, n))) / M[i][i]
+    return x
 
 
-def metodo_biseccion(f: Callable[[float], float], a: float, b: float, 
-                    tol: float = 1e-6, max_iter: int = 100) -> Tuple[float, int, List[float], List[float], List[float], float, float]:
+def metodo_newton_multivariable(F: Callable[[List[float]], List[float]], x0: List[float],
+                                tol: float = 1e-6, max_iter: int = 100, jacobiano: str = 'diferencias',
+                                busqueda_lineal: bool = False, tiempo_max: Optional[float] = None,
+                                max_evaluaciones: Optional[int] = None,
+                                cancelacion: Optional[Any] = None) -> Tuple[List[float], int, List[List[float]], List[float], List[float], float, float, str]:
     """
-    Implementa el metodo de biseccion para encontrar una raiz de f en [a, b].
+    Implementa el metodo de Newton para sistemas de ecuaciones no lineales.
+    
+    Con jacobiano='broyden' el jacobiano se calcula por diferencias solo al
+    inicio y luego se corrige con actualizaciones de rango uno de Broyden,
+    que cuestan una evaluacion de F por iteracion en vez de n + 1. Si la
+    actualizacion deja de producir un paso util, se recalcula por diferencias.
     
     Args:
-        f: Funcion cuya raiz se busca.
-        a: Extremo izquierdo del intervalo.
-        b: Extremo derecho del intervalo.
-        tol: Tolerancia para el criterio de parada.
+        F: Funcion vectorial cuya raiz se busca.
+        x0: Aproximacion inicial.
+        tol: Tolerancia para la norma del paso.
         max_iter: Numero maximo de iteraciones.
+        jacobiano: 'diferencias' o 'broyden'.
+        busqueda_lineal: Si es True, reduce el paso a la mitad hasta que la
+            norma de F disminuya (backtracking de Armijo).
+        tiempo_max: Tiempo maximo de la solucion en segundos.
+        max_evaluaciones: Numero maximo de evaluaciones de F.
+        cancelacion: Token de cancelacion externo (ej: threading.Event).
     
     Returns:
         Una tupla con la raiz aproximada, el numero de iteraciones realizadas,
-        una lista con los valores intermedios, una lista con los errores absolutos,
-        una lista con los errores relativos, el tiempo de ejecucion y el uso de memoria en bytes.
+        una lista con los vectores intermedios, una lista con las normas de los
+        pasos, una lista con los errores relativos, el tiempo de ejecucion, el
+        uso de memoria en bytes y el motivo de terminacion.
     """
-    # Verificar que f(a) y f(b) tengan signos opuestos
-    if f(a) * f(b) >= 0:
-        print(f"Error: f(a) = {f(a)} y f(b) = {f(b)} deben tener signos opuestos.")
-        return None, 0, [], [], [], 0, 0
+    F = aplicar_presupuesto(F, tiempo_max, max_evaluaciones, cancelacion)
     
     # Inicializacion
     tracemalloc.start()
     tiempo_inicio = time.time()
+    x = list(x0)
     contador_iter = 0
-    valores_c = [a]  # Incluir el valor inicial
+    valores_x = [list(x0)]
     errores_abs = [float('inf')]
     errores_rel = [float('inf')]
+    motivo = 'max_iter'
     
-    # Primera iteracion
-    c = (a + b) / 2
-    valores_c.append(c)
-    error_abs, error_rel = calcular_error(c, a)
-    errores_abs.append(error_abs)
-    errores_rel.append(error_rel)
-    
-    while (b - a) / 2 > tol and contador_iter < max_iter:
-        # Calcular el punto medio
-        c_prev = c
-        c = (a + b) / 2
-        valores_c.append(c)
-        
-        # Calcular errores
-        error_abs, error_rel = calcular_error(c, c_prev)
-        errores_abs.append(error_abs)
-        errores_rel.append(error_rel)
-        
-        # Evaluar la funcion en el punto medio
-        fc = f(c)
-        
-        # Verificar si c es una raiz
-        if abs(fc) < tol:
-            tiempo_fin = time.time()
-            memoria_actual, memoria_pico = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            return c, contador_iter + 1, valores_c, errores_abs, errores_rel, tiempo_fin - tiempo_inicio, memoria_pico
-        
-        # Actualizar el intervalo
-        if f(a) * fc < 0:
-            b = c
-        else:
-            a = c
+    try:
+        Fx = F(x)
+        J = jacobiano_numerico(F, x, Fx)
+        jacobiano_fresco = True
         
-        contador_iter += 1
+        while contador_iter < max_iter:
+            paso = resolver_lineal(J, [-fi for fi in Fx])
+            if paso is None and not jacobiano_fresco:
+                J = jacobiano_numerico(F, x, Fx)
+                jacobiano_fresco = True
+                continue
+            if paso is None:
+                print("Error: El jacobiano es singular. El metodo puede no converger.")
+                motivo = 'jacobiano_singular'
+                break
+            
+            # Busqueda lineal opcional sobre ||F||
+            lam = 1.0
+            x_nuevo = [xi + pi for xi, pi in zip(x, paso)]
+            F_nuevo = F(x_nuevo)
+            if busqueda_lineal:
+                norma_F = _norma(Fx)
+                while _norma(F_nuevo) > (1 - 1e-4 * lam) * norma_F and lam > 1e-3:
+                    lam /= 2
+                    x_nuevo = [xi + lam * pi for xi, pi in zip(x, paso)]
+                    F_nuevo = F(x_nuevo)
+                
+                # Con Broyden un paso que no mejora suele indicar un jacobiano
+                # desactualizado: se recalcula antes de aceptar el paso
+                if lam <= 1e-3 and not jacobiano_fresco:
+                    J = jacobiano_numerico(F, x, Fx)
+                    jacobiano_fresco = True
+                    continue
+            
+            s = [lam * pi for pi in paso]
+            valores_x.append(x_nuevo)
+            norma_paso = _norma(s)
+            norma_x = _norma(x_nuevo)
+            errores_abs.append(norma_paso)
+            errores_rel.append(norma_paso / norma_x if norma_x != 0 else float('inf'))
+            contador_iter += 1
+            
+            if jacobiano == 'broyden':
+                # J <- J + ((dF - J s) s^T) / (s^T s)
+                dF = [fn - fo for fn, fo in zip(F_nuevo, Fx)]
+                s_s = sum(si * si for si in s)
+                if s_s > 0:
+                    for i in range(len(J)):
+                        residuo = (dF[i] - sum(J[i][j] * s[j] for j in range(len(s)))) / s_s
+                        for j in range(len(s)):
+                            J[i][j] += residuo * s[j]
+                jacobiano_fresco = False
+            
+            x, Fx = x_nuevo, F_nuevo
+            
+            # Verificar el criterio de parada
+            if norma_paso < tol:
+                motivo = 'convergencia'
+                break
+            
+            if jacobiano != 'broyden':
+                J = jacobiano_numerico(F, x, Fx)
+    except PresupuestoAgotado as e:
+        print(f"Advertencia: {describir_motivo(e.motivo).capitalize()}; se retorna la ultima estimacion.")
+        motivo = e.motivo
+    
+    if motivo == 'max_iter':
+        print("Advertencia: Se alcanzo el numero maximo de iteraciones.")
+    tiempo, memoria_pico = _detener_medicion(tiempo_inicio)
+    return x, contador_iter, valores_x, errores_abs, errores_rel, tiempo, memoria_pico, motivo
+
+
+# Victorias de cada metodo en el modo carrera, por clase de ecuacion
+# Victorias por clase de ecuacion en este proceso; para acumularlas entre
+# ejecuciones se usan cargar_estadisticas_carrera y guardar_estadisticas_carrera
+ESTADISTICAS_CARRERA: Dict[str, Dict[str, int]] = {}
+
+
+def clasificar_ecuacion(ecuacion_str: str) -> str:
+    """
+    Clasifica una ecuacion segun las funciones que utiliza.
     
-    # Retornar el punto medio del intervalo final
-    c = (a + b) / 2
-    valores_c.append(c)
-    error_abs, error_rel = calcular_error(c, valores_c[-2])
-    errores_abs.append(error_abs)
-    errores_rel.append(error_rel)
+    Args:
+        ecuacion_str: Ecuacion a clasificar.
     
-    tiempo_fin = time.time()
-    memoria_actual, memoria_pico = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    return c, contador_iter + 1, valores_c, errores_abs, errores_rel, tiempo_fin - tiempo_inicio, memoria_pico
+    Returns:
+        'polinomica', 'trigonometrica', 'exponencial' o 'mixta'.
+    """
+    tiene_trig = re.search(r'(sin|cos|tan)\(', ecuacion_str) is not None
+    tiene_exp = re.search(r'(exp|log|ln|sqrt)\(', ecuacion_str) is not None
+    if tiene_trig and tiene_exp:
+        return 'mixta'
+    if tiene_trig:
+        return 'trigonometrica'
+    if tiene_exp:
+        return 'exponencial'
+    return 'polinomica'
 
 
-def metodo_newton_raphson(f: Callable[[float], float], x0: float, 
-                         tol: float = 1e-6, max_iter: int = 100) -> Tuple[float, int, List[float], List[float], List[float], float, float]:
+def verificar_residuo(f: Callable[[float], float], x: float, tol: float) -> bool:
     """
-    Implementa el metodo de Newton-Raphson para encontrar una raiz de f.
+    Verifica que x sea una raiz de f dentro de la tolerancia.
+    
+    Se acepta si |f(x)| <= tol o si la correccion de Newton |f(x)/f'(x)|,
+    que estima la distancia a la raiz, es menor o igual que tol.
+    
+    Args:
+        f: Funcion evaluada.
+        x: Raiz candidata.
+        tol: Tolerancia.
+    
+    Returns:
+        True si x pasa la verificacion.
+    """
+    if x is None:
+        return False
+    fx = f(x)
+    if math.isnan(fx):
+        return False
+    if abs(fx) <= tol:
+        return True
+    df = derivada(f, x, fx=fx)
+    return df != 0 and abs(fx / df) <= tol
+
+
+def carrera_metodos(f: Callable[[float], float], ecuacion_str: str, a: Optional[float] = None,
+                    b: Optional[float] = None, x0: Optional[float] = None, tol: float = 1e-6,
+                    max_iter: int = 100, tiempo_max: Optional[float] = None,
+                    max_evaluaciones: Optional[int] = None) -> Tuple[Optional[str], Optional[Tuple]]:
+    """
+    Ejecuta en paralelo los metodos disponibles y se queda con el primero que converge.
+    
+    Biseccion participa si se dan a y b; Newton-Raphson si se da x0. El primer
+    resultado que pasa verificar_residuo gana, los demas se cancelan y la
+    victoria se registra en ESTADISTICAS_CARRERA bajo la clase de la ecuacion.
+    Se usan hilos porque f es un cierre sobre eval que no se puede enviar a otro
+    proceso; el uso de memoria reportado es aproximado porque tracemalloc es global.
     
     Args:
         f: Funcion cuya raiz se busca.
-        x0: Aproximacion inicial.
+        ecuacion_str: Ecuacion resuelta, para clasificarla.
+        a: Extremo izquierdo del intervalo para biseccion.
+        b: Extremo derecho del intervalo para biseccion.
+        x0: Aproximacion inicial para Newton-Raphson.
         tol: Tolerancia para el criterio de parada.
         max_iter: Numero maximo de iteraciones.
+        tiempo_max: Tiempo maximo por metodo en segundos.
+        max_evaluaciones: Numero maximo de evaluaciones de f por metodo.
     
     Returns:
-        Una tupla con la raiz aproximada, el numero de iteraciones realizadas,
-        una lista con los valores intermedios, una lista con los errores absolutos,
-        una lista con los errores relativos, el tiempo de ejecucion y el uso de memoria en bytes.
+        Una tupla con el nombre del metodo ganador y sus resultados, o
+        (None, None) si ningun metodo paso la verificacion.
     """
-    # Inicializacion
-    tracemalloc.start()
-    tiempo_inicio = time.time()
-    x = x0
-    contador_iter = 0
-    valores_x = [x0]
-    errores_abs = [float('inf')]
-    errores_rel = [float('inf')]
+    # El metodo rapido se lanza primero y biseccion queda como respaldo robusto
+    candidatos = {}
+    if x0 is not None:
+        candidatos['Newton-Raphson'] = lambda cancelacion: metodo_newton_raphson(
+            f, x0, tol, max_iter, tiempo_max, max_evaluaciones, cancelacion)
+    if a is not None and b is not None:
+        candidatos['Biseccion'] = lambda cancelacion: metodo_biseccion(
+            f, a, b, tol, max_iter, tiempo_max, max_evaluaciones, cancelacion)
+    
+    if not candidatos:
+        print("Error: El modo carrera requiere el intervalo (a y b), la aproximacion inicial (x0) o ambos.")
+        return None, None
+    
+    cancelacion = threading.Event()
+    ganador, resultados_ganador = None, None
+    
+    ejecutor = ThreadPoolExecutor(max_workers=len(candidatos))
+    try:
+        futuros = {ejecutor.submit(metodo, cancelacion): nombre for nombre, metodo in candidatos.items()}
+        for futuro in as_completed(futuros):
+            try:
+                resultados = futuro.result()
+                valido = verificar_residuo(f, resultados[0], tol)
+            except Exception as e:
+                print(f"Advertencia: {futuros[futuro]} fallo durante la carrera: {e}")
+                continue
+            if valido:
+                ganador, resultados_ganador = futuros[futuro], resultados
+                # Los perdedores se detienen en su siguiente evaluacion de f
+                cancelacion.set()
+                break
+    finally:
+        # Sin esperar a los perdedores: la carrera dura lo que tarda el ganador
+        ejecutor.shutdown(wait=False, cancel_futures=True)
     
-    while contador_iter < max_iter:
-        # Calcular la derivada
-        df = derivada(f, x)
-        
-        # Verificar que la derivada no sea cero
-        if abs(df) < 1e-10:
-            print("Error: La derivada es cercana a cero. El metodo puede no converger.")
-            tiempo_fin = time.time()
-            memoria_actual, memoria_pico = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            return x, contador_iter, valores_x, errores_abs, errores_rel, tiempo_fin - tiempo_inicio, memoria_pico
-        
-        # Calcular la nueva aproximacion
-        x_nuevo = x - f(x) / df
-        valores_x.append(x_nuevo)
-        
-        # Calcular errores
-        error_abs, error_rel = calcular_error(x_nuevo, x)
-        errores_abs.append(error_abs)
-        errores_rel.append(error_rel)
-        
-        # Verificar el criterio de parada
-        if abs(x_nuevo - x) < tol:
-            tiempo_fin = time.time()
-            memoria_actual, memoria_pico = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            return x_nuevo, contador_iter + 1, valores_x, errores_abs, errores_rel, tiempo_fin - tiempo_inicio, memoria_pico
-        
-        # Actualizar x
-        x = x_nuevo
-        contador_iter += 1
+    if ganador is not None:
+        clase = clasificar_ecuacion(ecuacion_str)
+        victorias = ESTADISTICAS_CARRERA.setdefault(clase, {})
+        victorias[ganador] = victorias.get(ganador, 0) + 1
     
-    print("Advertencia: Se alcanzo el numero maximo de iteraciones.")
-    tiempo_fin = time.time()
-    memoria_actual, memoria_pico = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    return x, contador_iter, valores_x, errores_abs, errores_rel, tiempo_fin - tiempo_inicio, memoria_pico
+    return ganador, resultados_ganador
+
+
+def imprimir_estadisticas_carrera() -> None:
+    """Imprime cuantas veces gano cada metodo por clase de ecuacion."""
+    print("\nVictorias en modo carrera por clase de ecuacion:")
+    print("-" * 60)
+    print(f"{'Clase':^20} | {'Biseccion':^16} | {'Newton-Raphson':^16}")
+    print("-" * 60)
+    for clase, victorias in sorted(ESTADISTICAS_CARRERA.items()):
+        print(f"{clase:^20} | {victorias.get('Biseccion', 0):^16d} | {victorias.get('Newton-Raphson', 0):^16d}")
+
+
+def cargar_estadisticas_carrera(ruta: str) -> None:
+    """
+    Suma a ESTADISTICAS_CARRERA las victorias guardadas en un archivo JSON.
+    
+    Args:
+        ruta: Archivo escrito por guardar_estadisticas_carrera.
+    """
+    for clase, victorias in cargar_estado(ruta).items():
+        acumuladas = ESTADISTICAS_CARRERA.setdefault(clase, {})
+        for metodo, cantidad in victorias.items():
+            acumuladas[metodo] = acumuladas.get(metodo, 0) + int(cantidad)
+
+
+def guardar_estadisticas_carrera(ruta: str) -> None:
+    """
+    Guarda ESTADISTICAS_CARRERA en un archivo JSON.
+    
+    Args:
+        ruta: Archivo de destino.
+    """
+    guardar_estado(ESTADISTICAS_CARRERA, ruta)
 
 
 def imprimir_tabla(nombre_metodo: str, valores: List[float], errores_abs: List[float], 
@@ -264,6 +1675,29 @@ def imprimir_tabla(nombre_metodo: str, valores: List[float], errores_abs: List[f
         print(f"{i:^10} | {x:^15.8f} | {fx:^15.8e} | {err_abs:^15.8e} | {err_rel:^15.8e}")
 
 
+def imprimir_tabla_sistema(variables: List[str], valores: List[List[float]], errores_abs: List[float],
+                           F: Callable[[List[float]], List[float]]) -> None:
+    """
+    Imprime una tabla con los vectores intermedios de un sistema de ecuaciones.
+    
+    Args:
+        variables: Nombres de las variables.
+        valores: Lista de vectores intermedios.
+        errores_abs: Lista de normas de los pasos.
+        F: Funcion vectorial evaluada.
+    """
+    print("\nTabla de iteraciones para el metodo de Newton multivariable:")
+    ancho = 13 + 18 * len(variables) + 33
+    print("-" * ancho)
+    encabezado = " | ".join(f"{v:^15}" for v in variables)
+    print(f"{'Iteracion':^10} | {encabezado} | {'||F(x)||':^15} | {'||paso||':^15}")
+    print("-" * ancho)
+    
+    for i, (x, err_abs) in enumerate(zip(valores, errores_abs)):
+        componentes = " | ".join(f"{xi:^15.8f}" for xi in x)
+        print(f"{i:^10} | {componentes} | {_norma(F(x)):^15.8e} | {err_abs:^15.8e}")
+
+
 def comparar_metodos(resultados_biseccion, resultados_newton, ecuacion_str: str) -> None:
     """
     Compara los resultados de los metodos de biseccion y Newton-Raphson.
@@ -486,6 +1920,28 @@ def entrada_segura(mensaje: str, valor_predeterminado=None):
         sys.exit(0)
 
 
+@contextlib.contextmanager
+def cancelacion_con_ctrl_c():
+    """
+    Durante el bloque, Ctrl-C cancela la solucion en curso en vez de cerrar el programa.
+    
+    Yields:
+        Un threading.Event que se activa al presionar Ctrl-C, para pasarlo
+        como token de cancelacion a los metodos.
+    """
+    cancelacion = threading.Event()
+    
+    def manejador(signum, frame):
+        print("\n Cancelando el calculo en curso...")
+        cancelacion.set()
+    
+    anterior = signal.signal(signal.SIGINT, manejador)
+    try:
+        yield cancelacion
+    finally:
+        signal.signal(signal.SIGINT, anterior)
+
+
 def resolver_con_argumentos(args):
     """
     Resuelve una ecuacion utilizando argumentos de linea de comandos.
@@ -493,6 +1949,11 @@ def resolver_con_argumentos(args):
     Args:
         args: Argumentos de linea de comandos parseados.
     """
+    # Las raices complejas se buscan con su propio evaluador
+    if args.method == 'muller' or args.complex:
+        resolver_complejo_con_argumentos(args)
+        return
+    
     # Parsear la ecuacion
     f = analizar_ecuacion(args.equation)
     if f is None:
@@ -501,6 +1962,21 @@ def resolver_con_argumentos(args):
     # Parametros comunes
     tol = args.tolerance
     max_iter = args.max_iterations
+    tiempo_max = args.max_time
+    max_evaluaciones = args.max_evals
+    
+    # Puntos de control: uno por metodo, validos solo para la misma ecuacion
+    estados = {}
+    if args.state and os.path.exists(args.state):
+        estados = cargar_estado(args.state)
+        if estados.get('ecuacion') != args.equation:
+            print(f"Advertencia: El estado en '{args.state}' es de otra ecuacion; se empieza desde cero.")
+            estados = {}
+        else:
+            print(f"Reanudando desde el estado guardado en '{args.state}'.")
+    estados['ecuacion'] = args.equation
+    estado_biseccion = estados.setdefault('biseccion', {})
+    estado_newton = estados.setdefault('newton', {})
     
     # Variables para almacenar resultados
     resultados_biseccion = None
@@ -512,8 +1988,11 @@ def resolver_con_argumentos(args):
         print("METODO DE BISECCION".center(60))
         print("-" * 60)
         
-        # Verificar que se proporcionaron los limites del intervalo
-        if args.a is None or args.b is None:
+        # Reanudar desde el punto de control o verificar que se proporcionaron los limites del intervalo
+        if estado_biseccion:
+            resultados_biseccion = metodo_biseccion(f, None, None, tol, max_iter, tiempo_max=tiempo_max,
+                                                    max_evaluaciones=max_evaluaciones, estado=estado_biseccion)
+        elif args.a is None or args.b is None:
             print("Error: Para el metodo de biseccion se requieren los limites del intervalo (a y b).")
             if args.method != 'both':
                 sys.exit(1)
@@ -530,20 +2009,23 @@ def resolver_con_argumentos(args):
                     sys.exit(1)
             else:
                 # Ejecutar el metodo de biseccion
-                resultados_biseccion = metodo_biseccion(f, a, b, tol, max_iter)
-                
-                if resultados_biseccion[0] is not None:
-                    print(f"\nRaiz encontrada: {resultados_biseccion[0]:.10f}")
-                    print(f"Valor de f(raiz): {f(resultados_biseccion[0]):.10e}")
-                    print(f"Iteraciones realizadas: {resultados_biseccion[1]}")
-                    print(f"Error absoluto final: {resultados_biseccion[3][-1]:.10e}")
-                    print(f"Error relativo final: {resultados_biseccion[4][-1]:.10e}")
-                    print(f"Tiempo de ejecucion: {resultados_biseccion[5]:.6f} segundos")
-                    print(f"Uso de memoria: {resultados_biseccion[6]} bytes")
-                    
-                    # Imprimir tabla de iteraciones
-                    imprimir_tabla("Biseccion", resultados_biseccion[2], resultados_biseccion[3], 
-                               resultados_biseccion[4], f)
+                resultados_biseccion = metodo_biseccion(f, a, b, tol, max_iter,
+                                                        tiempo_max=tiempo_max, max_evaluaciones=max_evaluaciones,
+                                                        estado=estado_biseccion)
+        
+        if resultados_biseccion is not None and resultados_biseccion[0] is not None:
+            print(f"\nRaiz encontrada: {resultados_biseccion[0]:.10f}")
+            print(f"Valor de f(raiz): {f(resultados_biseccion[0]):.10e}")
+            print(f"Iteraciones realizadas: {resultados_biseccion[1]}")
+            print(f"Error absoluto final: {resultados_biseccion[3][-1]:.10e}")
+            print(f"Error relativo final: {resultados_biseccion[4][-1]:.10e}")
+            print(f"Tiempo de ejecucion: {resultados_biseccion[5]:.6f} segundos")
+            print(f"Uso de memoria: {resultados_biseccion[6]} bytes")
+            print(f"Motivo de terminacion: {describir_motivo(resultados_biseccion[7])}")
+            
+            # Imprimir tabla de iteraciones
+            imprimir_tabla("Biseccion", resultados_biseccion[2], resultados_biseccion[3], 
+                       resultados_biseccion[4], f)
     
     if args.method in ['newton', 'both']:
         print("\n" + "-" * 60)
@@ -551,12 +2033,25 @@ def resolver_con_argumentos(args):
         print("-" * 60)
         
         # Verificar que se proporciono la aproximacion inicial
-        if args.x0 is None:
+        if args.x0 is None and not estado_newton:
             print("Error: Para el metodo de Newton-Raphson se requiere una aproximacion inicial (x0).")
             sys.exit(1)
         
+        # Intervalo de respaldo si el monitor diagnostica un fallo
+        respaldo = (args.a, args.b) if args.fallback and args.a is not None and args.b is not None else None
+        
         # Ejecutar el metodo de Newton-Raphson
-        resultados_newton = metodo_newton_raphson(f, args.x0, tol, max_iter)
+        informe = {}
+        if args.precision == 'auto':
+            resultados_newton = metodo_newton_raphson_adaptativo(f, args.equation, args.x0, tol, max_iter,
+                                                                 tiempo_max=tiempo_max, max_evaluaciones=max_evaluaciones,
+                                                                 estado=estado_newton, monitorear=not args.no_monitor,
+                                                                 respaldo=respaldo, informe=informe)
+        else:
+            resultados_newton = metodo_newton_raphson(f, args.x0, tol, max_iter,
+                                                      tiempo_max=tiempo_max, max_evaluaciones=max_evaluaciones,
+                                                      estado=estado_newton, monitorear=not args.no_monitor,
+                                                      respaldo=respaldo, informe=informe)
         
         print(f"\nRaiz encontrada: {resultados_newton[0]:.10f}")
         print(f"Valor de f(raiz): {f(resultados_newton[0]):.10e}")
@@ -565,16 +2060,183 @@ def resolver_con_argumentos(args):
         print(f"Error relativo final: {resultados_newton[4][-1]:.10e}")
         print(f"Tiempo de ejecucion: {resultados_newton[5]:.6f} segundos")
         print(f"Uso de memoria: {resultados_newton[6]} bytes")
+        print(f"Motivo de terminacion: {describir_motivo(resultados_newton[7])}")
+        # Tras el respaldo el resultado es de biseccion: el orden de Newton no aplica
+        if (informe.get('metodo') == 'newton' and informe.get('orden') is not None
+                and resultados_newton[7] == 'convergencia'):
+            print(f"Orden de convergencia observado: p = {informe['orden']:.2f}, "
+                  f"constante asintotica C = {informe['constante']:.4e}")
+            if informe.get('convergencia_lineal'):
+                print("Convergencia lineal: posible raiz multiple.")
         
         # Imprimir tabla de iteraciones
         imprimir_tabla("Newton-Raphson", resultados_newton[2], resultados_newton[3], 
                    resultados_newton[4], f)
     
+    if args.method == 'deflacion':
+        print("\n" + "-" * 60)
+        print("METODO DE NEWTON-RAPHSON CON DEFLACION".center(60))
+        print("-" * 60)
+        
+        if args.x0 is None:
+            print("Error: Para el metodo de deflacion se requiere una aproximacion inicial (x0).")
+            sys.exit(1)
+        
+        raices, multiplicidades, iteraciones, tiempo, memoria, motivo = metodo_newton_deflacion(
+            f, args.x0, args.roots, tol, max_iter, tiempo_max=tiempo_max, max_evaluaciones=max_evaluaciones)
+        
+        print(f"\nRaices encontradas: {len(raices)} de {args.roots} buscadas")
+        print("-" * 60)
+        print(f"{'Raiz':^20} | {'Multiplicidad':^15} | {'f(raiz)':^18}")
+        print("-" * 60)
+        for r, m in zip(raices, multiplicidades):
+            print(f"{r:^20.10f} | {m:^15d} | {f(r):^18.8e}")
+        print(f"\nIteraciones realizadas: {iteraciones}")
+        print(f"Tiempo de ejecucion: {tiempo:.6f} segundos")
+        print(f"Uso de memoria: {memoria} bytes")
+        if len(raices) < args.roots:
+            print(f"Motivo de terminacion: {describir_motivo(motivo)}")
+    
+    if args.method == 'race':
+        print("\n" + "-" * 60)
+        print("CARRERA DE METODOS".center(60))
+        print("-" * 60)
+        
+        if args.race_stats and os.path.exists(args.race_stats):
+            cargar_estadisticas_carrera(args.race_stats)
+        
+        ganador, resultados = carrera_metodos(f, args.equation, args.a, args.b, args.x0, tol, max_iter,
+                                              tiempo_max, max_evaluaciones)
+        if args.race_stats:
+            guardar_estadisticas_carrera(args.race_stats)
+        if ganador is None:
+            print("\nNingun metodo encontro una raiz que pase la verificacion del residuo.")
+            sys.exit(1)
+        
+        print(f"\nMetodo ganador: {ganador}")
+        print(f"Raiz encontrada: {resultados[0]:.10f}")
+        print(f"Valor de f(raiz): {f(resultados[0]):.10e}")
+        print(f"Iteraciones realizadas: {resultados[1]}")
+        print(f"Error absoluto final: {resultados[3][-1]:.10e}")
+        print(f"Tiempo de ejecucion: {resultados[5]:.6f} segundos")
+        print(f"Motivo de terminacion: {describir_motivo(resultados[7])}")
+        
+        imprimir_tabla(ganador, resultados[2], resultados[3], resultados[4], f)
+        imprimir_estadisticas_carrera()
+    
+    if args.state and args.method in ['biseccion', 'newton', 'both']:
+        guardar_estado(estados, args.state)
+        print(f"\nEstado guardado en '{args.state}'.")
+    
     # Comparar metodos si se ejecutaron ambos
     if args.method == 'both' and resultados_biseccion is not None and resultados_newton is not None:
         comparar_metodos(resultados_biseccion, resultados_newton, args.equation)
 
 
+def resolver_complejo_con_argumentos(args):
+    """
+    Busca una raiz compleja de una ecuacion utilizando argumentos de linea de comandos.
+    
+    Args:
+        args: Argumentos de linea de comandos parseados.
+    """
+    f = analizar_ecuacion_compleja(args.equation)
+    if f is None:
+        sys.exit(1)
+    
+    if args.method not in ['newton', 'muller']:
+        print("Error: En el plano complejo solo estan disponibles los metodos newton y muller.")
+        sys.exit(1)
+    
+    if args.z0 is not None:
+        z0 = complex(args.z0.replace(' ', '').replace('i', 'j'))
+    elif args.x0 is not None:
+        z0 = complex(args.x0)
+    else:
+        print("Error: Se requiere una aproximacion inicial (z0 o x0).")
+        sys.exit(1)
+    
+    if args.method == 'muller':
+        print("\n" + "-" * 60)
+        print("METODO DE MULLER".center(60))
+        print("-" * 60)
+        resultados = metodo_muller(f, z0, tol=args.tolerance, max_iter=args.max_iterations,
+                                   tiempo_max=args.max_time, max_evaluaciones=args.max_evals,
+                                   monitorear=not args.no_monitor)
+        nombre_metodo = "Muller"
+    else:
+        print("\n" + "-" * 60)
+        print("METODO DE NEWTON-RAPHSON COMPLEJO".center(60))
+        print("-" * 60)
+        
+        # Con f de coeficientes reales, Newton nunca sale del eje real si empieza en el
+        if z0.imag == 0:
+            z0 += 1e-3j
+            print(f"Nota: z0 es real; se usa z0 = {z0} para que el metodo pueda salir del eje real.")
+        resultados = metodo_newton_raphson(f, z0, args.tolerance, args.max_iterations,
+                                           tiempo_max=args.max_time, max_evaluaciones=args.max_evals,
+                                           monitorear=not args.no_monitor)
+        nombre_metodo = "Newton-Raphson complejo"
+    
+    print(f"\nRaiz encontrada: {resultados[0]:.10f}")
+    print(f"Valor de f(raiz): {f(resultados[0]):.10e}")
+    print(f"Iteraciones realizadas: {resultados[1]}")
+    print(f"Error absoluto final: {resultados[3][-1]:.10e}")
+    print(f"Tiempo de ejecucion: {resultados[5]:.6f} segundos")
+    print(f"Uso de memoria: {resultados[6]} bytes")
+    print(f"Motivo de terminacion: {describir_motivo(resultados[7])}")
+    
+    imprimir_tabla(nombre_metodo, resultados[2], resultados[3], resultados[4], f)
+
+
+def resolver_sistema_con_argumentos(args):
+    """
+    Resuelve un sistema de ecuaciones utilizando argumentos de linea de comandos.
+    
+    Args:
+        args: Argumentos de linea de comandos parseados.
+    """
+    ecuaciones = [e.strip() for e in args.system.split(';') if e.strip()]
+    variables = [v.strip() for v in args.variables.split(',')] if args.variables else None
+    
+    F, variables = analizar_sistema(ecuaciones, variables)
+    if F is None:
+        sys.exit(1)
+    
+    if len(ecuaciones) != len(variables):
+        print(f"Error: El sistema tiene {len(ecuaciones)} ecuaciones y {len(variables)} variables ({', '.join(variables)}).")
+        sys.exit(1)
+    
+    if args.initial is None:
+        print(f"Error: Para un sistema se requiere una aproximacion inicial para {', '.join(variables)} (--initial).")
+        sys.exit(1)
+    
+    x0 = [float(v) for v in args.initial.split(',')]
+    if len(x0) != len(variables):
+        print(f"Error: La aproximacion inicial debe tener {len(variables)} componentes.")
+        sys.exit(1)
+    
+    print("\n" + "-" * 60)
+    print("METODO DE NEWTON MULTIVARIABLE".center(60))
+    print("-" * 60)
+    
+    resultados = metodo_newton_multivariable(F, x0, args.tolerance, args.max_iterations,
+                                             jacobiano=args.jacobian, busqueda_lineal=args.line_search,
+                                             tiempo_max=args.max_time, max_evaluaciones=args.max_evals)
+    
+    print("\nRaiz encontrada:")
+    for nombre, valor in zip(variables, resultados[0]):
+        print(f"  {nombre} = {valor:.10f}")
+    print(f"Norma de F(raiz): {_norma(F(resultados[0])):.10e}")
+    print(f"Iteraciones realizadas: {resultados[1]}")
+    print(f"Norma del ultimo paso: {resultados[3][-1]:.10e}")
+    print(f"Tiempo de ejecucion: {resultados[5]:.6f} segundos")
+    print(f"Uso de memoria: {resultados[6]} bytes")
+    print(f"Motivo de terminacion: {describir_motivo(resultados[7])}")
+    
+    imprimir_tabla_sistema(variables, resultados[2], resultados[3], F)
+
+
 def modo_interactivo():
     """Funcion para el modo interactivo del programa."""
     print("\n" + "=" * 70)
@@ -656,6 +2318,12 @@ def modo_interactivo():
             print("  Valor recomendado: 100")
             max_iter = int(entrada_segura(" Ingresa el numero maximo de iteraciones (presiona ENTER para usar 100): ", "100"))
             
+            print("\n TIEMPO MAXIMO:")
+            print("  Limite de tiempo en segundos para cada metodo. Al agotarse se muestra")
+            print("  la mejor estimacion obtenida. Ctrl-C tambien detiene el calculo en curso.")
+            tiempo_max_str = entrada_segura(" Ingresa el tiempo maximo (presiona ENTER para no limitar): ", "")
+            tiempo_max = float(tiempo_max_str) if tiempo_max_str.strip() else None
+            
             # Variables para almacenar resultados
             resultados_biseccion = None
             resultados_newton = None
@@ -687,7 +2355,9 @@ def modo_interactivo():
                 else:
                     print("\n Calculando solucion mediante biseccion...")
                     # Ejecutar el metodo de biseccion
-                    resultados_biseccion = metodo_biseccion(f, a, b, tol, max_iter)
+                    with cancelacion_con_ctrl_c() as cancelacion:
+                        resultados_biseccion = metodo_biseccion(f, a, b, tol, max_iter, tiempo_max=tiempo_max,
+                                                                cancelacion=cancelacion)
                     
                     if resultados_biseccion[0] is not None:
                         print("\n RESULTADOS DEL METODO DE BISECCION:")
@@ -698,6 +2368,7 @@ def modo_interactivo():
                         print(f"  • Error relativo final: {resultados_biseccion[4][-1]:.10e}")
                         print(f"  • Tiempo de ejecucion: {resultados_biseccion[5]:.6f} segundos")
                         print(f"  • Uso de memoria: {resultados_biseccion[6]} bytes")
+                        print(f"  • Motivo de terminacion: {describir_motivo(resultados_biseccion[7])}")
                         
                         # Preguntar si desea ver la tabla de iteraciones
                         mostrar_tabla = entrada_segura("\n ¿Deseas ver la tabla de iteraciones? (s/n): ")
@@ -721,7 +2392,9 @@ def modo_interactivo():
                 
                 print("\n Calculando solucion mediante Newton-Raphson...")
                 # Ejecutar el metodo de Newton-Raphson
-                resultados_newton = metodo_newton_raphson(f, x0, tol, max_iter)
+                with cancelacion_con_ctrl_c() as cancelacion:
+                    resultados_newton = metodo_newton_raphson(f, x0, tol, max_iter, tiempo_max=tiempo_max,
+                                                              cancelacion=cancelacion)
                 
                 print("\n RESULTADOS DEL METODO DE NEWTON-RAPHSON:")
                 print(f"  • Raiz encontrada: {resultados_newton[0]:.10f}")
@@ -731,6 +2404,7 @@ def modo_interactivo():
                 print(f"  • Error relativo final: {resultados_newton[4][-1]:.10e}")
                 print(f"  • Tiempo de ejecucion: {resultados_newton[5]:.6f} segundos")
                 print(f"  • Uso de memoria: {resultados_newton[6]} bytes")
+                print(f"  • Motivo de terminacion: {describir_motivo(resultados_newton[7])}")
                 
                 # Preguntar si desea ver la tabla de iteraciones
                 mostrar_tabla = entrada_segura("\n ¿Deseas ver la tabla de iteraciones? (s/n): ")
@@ -761,21 +2435,54 @@ def principal():
     # Configurar el parser de argumentos
     parser = argparse.ArgumentParser(description='Solucionador de ecuaciones no lineales')
     parser.add_argument('-e', '--equation', help='Ecuacion a resolver (f(x) = 0)')
-    parser.add_argument('-m', '--method', choices=['biseccion', 'newton', 'both'], 
-                        help='Metodo a utilizar: biseccion, newton o both')
+    parser.add_argument('-m', '--method', choices=['biseccion', 'newton', 'both', 'race', 'deflacion', 'muller'], 
+                        help='Metodo a utilizar: biseccion, newton, both, race '
+                             '(ejecuta los metodos en paralelo y toma el primero que converge), '
+                             'deflacion (varias raices desde x0) o muller (raices complejas)')
+    parser.add_argument('-k', '--roots', type=int, default=3,
+                        help='Numero maximo de raices a buscar con deflacion (default: 3)')
     parser.add_argument('-a', type=float, help='Extremo izquierdo del intervalo para biseccion')
     parser.add_argument('-b', type=float, help='Extremo derecho del intervalo para biseccion')
     parser.add_argument('-x0', type=float, help='Aproximacion inicial para Newton-Raphson')
+    parser.add_argument('-z0', '--z0', help='Aproximacion inicial compleja (ej: 1+2j) para muller o newton con --complex')
+    parser.add_argument('-c', '--complex', action='store_true',
+                        help='Evaluar la ecuacion en el plano complejo (cmath) y buscar raices complejas')
     parser.add_argument('-t', '--tolerance', type=float, default=1e-6, 
                         help='Tolerancia para el criterio de parada (default: 1e-6)')
     parser.add_argument('-i', '--max-iterations', type=int, default=100, 
                         help='Numero maximo de iteraciones (default: 100)')
+    parser.add_argument('-p', '--precision', choices=['float', 'auto'], default='float',
+                        help='Precision de Newton-Raphson: float (solo float64) o auto '
+                             '(refina en alta precision si float64 no alcanza) (default: float)')
+    parser.add_argument('--max-time', type=float, default=None,
+                        help='Tiempo maximo por metodo en segundos (default: sin limite)')
+    parser.add_argument('--max-evals', type=int, default=None,
+                        help='Numero maximo de evaluaciones de f por metodo (default: sin limite)')
+    parser.add_argument('-s', '--system',
+                        help='Sistema de ecuaciones separadas por ";" (ej: "x^2 + y^2 - 4; x - y")')
+    parser.add_argument('--variables', help='Variables del sistema separadas por comas (default: detectadas)')
+    parser.add_argument('--initial', help='Aproximacion inicial del sistema separada por comas (ej: 1,1)')
+    parser.add_argument('--jacobian', choices=['diferencias', 'broyden'], default='diferencias',
+                        help='Jacobiano del sistema: diferencias finitas en cada paso o '
+                             'actualizaciones de Broyden (default: diferencias)')
+    parser.add_argument('--line-search', action='store_true',
+                        help='Usar busqueda lineal en el metodo de Newton multivariable')
+    parser.add_argument('--state', help='Archivo JSON de punto de control: si existe se reanuda desde el, '
+                                        'y al terminar se guarda el estado (biseccion y newton)')
+    parser.add_argument('--race-stats', help='Archivo JSON donde se acumulan las victorias del modo carrera '
+                                             'entre ejecuciones')
+    parser.add_argument('--no-monitor', action='store_true',
+                        help='No detener Newton-Raphson al detectar ciclos, divergencia o estancamiento')
+    parser.add_argument('--fallback', action='store_true',
+                        help='Si Newton-Raphson falla, continuar con biseccion en el intervalo [a, b]')
     parser.add_argument('-f', '--file', help='Archivo con parametros de entrada')
     
     args = parser.parse_args()
     
     # Verificar si se proporcionaron argumentos para el modo no interactivo
-    if args.equation and args.method:
+    if args.system:
+        resolver_sistema_con_argumentos(args)
+    elif args.equation and args.method:
         resolver_con_argumentos(args)
     elif args.file:
         # Leer parametros desde un archivo
@@ -802,16 +2509,48 @@ def principal():
                 args.b = float(params['b'])
             if 'x0' in params:
                 args.x0 = float(params['x0'])
+            if 'z0' in params:
+                args.z0 = params['z0']
+            if 'complex' in params:
+                args.complex = params['complex'].lower() in ['1', 'true', 'si', 'yes']
             if 'tolerance' in params:
                 args.tolerance = float(params['tolerance'])
             if 'max_iterations' in params:
                 args.max_iterations = int(params['max_iterations'])
+            if 'roots' in params:
+                args.roots = int(params['roots'])
+            if 'precision' in params:
+                args.precision = params['precision']
+            if 'max_time' in params:
+                args.max_time = float(params['max_time'])
+            if 'max_evals' in params:
+                args.max_evals = int(params['max_evals'])
+            if 'state' in params:
+                args.state = params['state']
+            if 'race_stats' in params:
+                args.race_stats = params['race_stats']
+            if 'monitor' in params:
+                args.no_monitor = params['monitor'].lower() in ['0', 'false', 'no']
+            if 'fallback' in params:
+                args.fallback = params['fallback'].lower() in ['1', 'true', 'si', 'yes']
+            if 'system' in params:
+                args.system = params['system']
+            if 'variables' in params:
+                args.variables = params['variables']
+            if 'initial' in params:
+                args.initial = params['initial']
+            if 'jacobian' in params:
+                args.jacobian = params['jacobian']
+            if 'line_search' in params:
+                args.line_search = params['line_search'].lower() in ['1', 'true', 'si', 'yes']
             
             # Verificar si se tienen los parametros minimos necesarios
-            if args.equation and args.method:
+            if args.system:
+                resolver_sistema_con_argumentos(args)
+            elif args.equation and args.method:
                 resolver_con_argumentos(args)
             else:
-                print("Error: El archivo de parametros debe contener al menos 'equation' y 'method'.")
+                print("Error: El archivo de parametros debe contener 'system' o al menos 'equation' y 'method'.")
                 sys.exit(1)
         except Exception as e:
             print(f"Error al leer el archivo de parametros: {e}")